@@ -0,0 +1,19 @@
+import math
+
+
+def wrap180(angle: float) -> float:
+    """
+    Normalize an angle in degrees to [-180, 180).
+
+    Used for signed longitude differences, e.g. `wrap180(lon - target)` is
+    negative before a body reaches `target` and positive after it.
+    """
+    # The difference of two longitudes in [0, 360) needs at most one turn
+    # added or removed, which is cheaper as a branch than a floor
+    if -540.0 <= angle < 540.0:
+        if angle >= 180.0:
+            return angle - 360.0
+        if angle < -180.0:
+            return angle + 360.0
+        return angle
+    return angle - 360.0 * math.floor(angle / 360.0 + 0.5)
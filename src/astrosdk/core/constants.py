@@ -14,6 +14,10 @@ class ZodiacSign(IntEnum):
     AQUARIUS = 10
     PISCES = 11
 
+# Sign members indexed by sign number; avoids the Enum value lookup on hot paths.
+_ZODIAC_BY_INDEX = tuple(ZodiacSign(i) for i in range(12))
+_INV_30 = 1.0 / 30.0  # multiply instead of dividing by the 30-degree sign span
+
 class HouseSystem(str, Enum):
     PLACIDUS = 'P'
     KOCH = 'K'
@@ -125,12 +129,27 @@ DEFAULT_TIDAL = 999999 # swe.TIDAL_AUTOMATIC
 DEFAULT_SIDEREAL = SiderealMode.LAHIRI
 
 # Security Policy: Only allow historically/astronomically verified bodies by default
-ALLOWED_PLANETS = {
+ALLOWED_PLANETS = frozenset({
     Planet.SUN, Planet.MOON, Planet.MERCURY, Planet.VENUS, Planet.MARS,
     Planet.JUPITER, Planet.SATURN, Planet.URANUS, Planet.NEPTUNE, Planet.PLUTO,
     Planet.TRUE_NODE, Planet.MEAN_NODE, Planet.LILITH_MEAN, Planet.LILITH_TRUE,
     Planet.CHIRON, Planet.CERES, Planet.PALLAS, Planet.JUNO, Planet.VESTA
-}
+})
 
 # Performance Guardrails
 MAX_SEARCH_DAYS = 36525 # ~100 years
+SCAN_BATCH_SIZE = 64 # Broad-scan grid points evaluated per ephemeris batch
+
+# Broad-scan step per body, in days. Roughly a tenth of the body's shortest
+# retrograde loop, so a target inside the loop is still seen as three
+# separate crossings; bodies that never station can step further.
+SCAN_STEP_DAYS = {
+    Planet.SUN: 5.0, Planet.MOON: 0.5,
+    Planet.MERCURY: 2.0, Planet.VENUS: 4.0, Planet.MARS: 6.0,
+    Planet.JUPITER: 12.0, Planet.SATURN: 14.0, Planet.URANUS: 15.0,
+    Planet.NEPTUNE: 15.0, Planet.PLUTO: 15.0,
+    Planet.MEAN_NODE: 10.0, Planet.LILITH_MEAN: 10.0,
+    Planet.CHIRON: 15.0, Planet.CERES: 10.0, Planet.PALLAS: 8.0,
+    Planet.JUNO: 8.0, Planet.VESTA: 8.0,
+}
+DEFAULT_SCAN_STEP_DAYS = 0.5 # Oscillating points (true node, true Lilith)
@@ -1,14 +1,170 @@
 import swisseph as swe
+import functools
 from threading import RLock
-from typing import Optional, Dict, Set
+from typing import Any, Callable, Optional, Dict, Set, List, Iterable, Tuple, NamedTuple, SupportsIndex, Union, overload
 import os
 from dotenv import load_dotenv, find_dotenv
 from .constants import SiderealMode, Planet, HouseSystem, DEFAULT_EPHE_FLAG, ALLOWED_PLANETS, MAX_SEARCH_DAYS
+from .roots import find_root
 from .errors import EphemerisError, ConfigurationError, UnsupportedPlanetError, InvalidTimeStandardError, SearchRangeTooLargeError
 
-# Global library-level lock to protect the shared mutable state of pyswisseph
+# Global library-level lock to protect the shared mutable state of pyswisseph.
+# Reads need it too, not just writers: calc_ut, houses etc. share static
+# buffers and open ephemeris file handles inside the C library, so a
+# reader-writer split would still race.
+# Reentrant on purpose: composite operations such as
+# NatalService.calculate_chart_data hold it across several Ephemeris calls
+# so that no other thread can change the sidereal mode in between.
 _SWISS_LOCK = RLock()
 
+
+class PlanetResult(NamedTuple):
+    """
+    Position and daily speeds of a body, as returned by `Ephemeris.calculate_planet`.
+
+    Read fields as attributes (`pos.longitude`). For code written against
+    the dictionaries this used to be, the read-only mapping methods still
+    work (`pos["longitude"]`, `"longitude" in pos`, `get`, `keys`, `values`,
+    `items`, `dict(pos)`), but are slower. Unlike a dict, iterating yields
+    the values, the result is immutable, and `json.dumps` writes a list;
+    use `pos._asdict()` where a real dict is needed.
+    """
+    longitude: float
+    latitude: float
+    distance: float
+    speed_long: float
+    speed_lat: float
+    speed_dist: float
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> float: ...
+    @overload
+    def __getitem__(self, key: slice) -> Tuple[float, ...]: ...
+    @overload
+    def __getitem__(self, key: str) -> float: ...
+    def __getitem__(self, key: Union[SupportsIndex, slice, str]) -> Union[float, Tuple[float, ...]]:
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)  # type: ignore[no-any-return]
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+
+    def get(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        return self[key] if key in self._fields else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> Tuple[float, ...]:
+        return tuple(self)
+
+    def items(self) -> Tuple[Tuple[str, float], ...]:
+        return tuple(zip(self._fields, self, strict=True))
+
+
+def _build_calc_flags(sidereal: bool, heliocentric: bool) -> int:
+    flags = DEFAULT_EPHE_FLAG | swe.FLG_SPEED
+    if sidereal:
+        flags |= swe.FLG_SIDEREAL
+    if heliocentric:
+        flags |= swe.FLG_HELCTR  # Heliocentric flag
+    return flags
+
+# The flag and house-system spaces are tiny, so build every value once at import
+_CALC_FLAGS: Dict[Tuple[bool, bool], int] = {(sid, helio): _build_calc_flags(sid, helio) for sid in (False, True) for helio in (False, True)}
+_SYS_BYTES: Dict[HouseSystem, bytes] = {system: system.value.encode('ascii') for system in HouseSystem}
+
+def _calc_flags(sidereal: bool, heliocentric: bool) -> int:
+    return _CALC_FLAGS[bool(sidereal), bool(heliocentric)]
+
+# pyswisseph has no getters for the global settings that change calc_ut output,
+# so they are tracked here and folded into the memoization key below.
+# Only modify them through _set_sid_mode/_set_tid_acc while holding _SWISS_LOCK.
+# None means "never set", so the first call always reaches the library.
+_sid_state: Optional[Tuple[SiderealMode, float, float]] = None
+_tidal_state: Optional[float] = None
+
+def _set_sid_mode(mode: SiderealMode, t0: float = 0.0, ayan_t0: float = 0.0) -> None:
+    global _sid_state
+    state = (mode, t0, ayan_t0)
+    if state == _sid_state:
+        return
+    swe.set_sid_mode(mode, t0, ayan_t0)
+    _sid_state = state
+
+def _use_sid_mode(mode: SiderealMode) -> None:
+    # Selecting the active mode again keeps the t0/ayan_t0 it was set with,
+    # so a custom epoch survives calls that only name a mode
+    if _sid_state is None or _sid_state[0] != mode:
+        _set_sid_mode(mode)
+
+def _set_tid_acc(value: float) -> None:
+    global _tidal_state
+    if value == _tidal_state:
+        return
+    swe.set_tid_acc(value)
+    _tidal_state = value
+
+@functools.lru_cache(maxsize=4096)
+def _calc_ut_cached(jd: float, planet: int, flags: int, sid_state: Optional[Tuple[SiderealMode, float, float]],
+                    tidal_state: Optional[float]) -> PlanetResult:
+    # Results are immutable, so the cached object is handed out as is
+    return PlanetResult._make(swe.calc_ut(jd, planet, flags)[0])
+
+def _calc_ut(jd: float, planet: int, flags: int) -> PlanetResult:
+    """Memoized swe.calc_ut coordinates. Caller must hold _SWISS_LOCK."""
+    sid_state = _sid_state if flags & swe.FLG_SIDEREAL else None
+    return _calc_ut_cached(jd, planet, flags, sid_state, _tidal_state)
+
+@functools.lru_cache(maxsize=1024)
+def _ayanamsa_cached(jd: float, sid_state: Optional[Tuple[SiderealMode, float, float]],
+                     tidal_state: Optional[float]) -> float:
+    return float(swe.get_ayanamsa_ut(jd))
+
+def _ayanamsa_ut(jd: float) -> float:
+    """Memoized swe.get_ayanamsa_ut for the current mode. Caller must hold _SWISS_LOCK."""
+    return _ayanamsa_cached(jd, _sid_state, _tidal_state)
+
+@functools.lru_cache(maxsize=256)
+def _fixstar_mag(star_name: str) -> float:
+    # Catalog magnitudes do not depend on time or any mode setting
+    res_mag = swe.fixstar_mag(star_name)
+    return float(res_mag[0] if isinstance(res_mag, (tuple, list)) else res_mag)
+
+def _check_search_range(jd_start: float, jd_end: float) -> None:
+    search_range = abs(jd_end - jd_start)
+    if search_range > MAX_SEARCH_DAYS:
+        raise SearchRangeTooLargeError(
+            f"Search range of {search_range:.0f} days exceeds maximum allowed "
+            f"({MAX_SEARCH_DAYS} days / ~{MAX_SEARCH_DAYS/365.25:.0f} years)"
+        )
+
+def _search_eclipses(when_func: Callable[..., Any], label: str, jd_start: float, jd_end: float) -> List[Dict[str, float]]:
+    # One critical section for the whole range instead of one per eclipse
+    results = []
+    jd = jd_start
+    with _SWISS_LOCK:
+        try:
+            while jd <= jd_end:
+                res, tret = when_func(jd, DEFAULT_EPHE_FLAG, 0, False)
+                if tret[0] > jd_end:
+                    break
+                results.append({
+                    "peak_jd": tret[0],
+                    "magnitude": 1.0,
+                    "type": res
+                })
+                # Consecutive eclipses of a kind are at least a lunation apart
+                jd = tret[0] + 1.0
+        except Exception as e:
+            raise EphemerisError(f"{label} eclipse search failed: {str(e)}")
+    return results
+
 class Ephemeris:
     """
     Singleton-style wrapper for Swiss Ephemeris.
@@ -18,17 +174,22 @@ class Ephemeris:
     _lock = RLock()
     
     def __new__(cls):
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super(Ephemeris, cls).__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+                    instance = super(Ephemeris, cls).__new__(cls)
+                    instance._setup()
+                    # Publish only once fully set up, so later callers never
+                    # see a half-initialized engine or take any lock
+                    cls._instance = instance
+                instance = cls._instance
+        return instance
 
-    def __init__(self):
-        if self._initialized:
-            return
-            
+    def _setup(self) -> None:
+        """
+        One-time library setup, run by __new__ under the class lock.
+        """
         with _SWISS_LOCK:
             self._sidereal_mode = SiderealMode.LAHIRI
             
@@ -41,13 +202,11 @@ class Ephemeris:
             try:
                 swe.set_ephe_path(self._ephe_path)
                 # Set default sidereal mode
-                swe.set_sid_mode(self._sidereal_mode, 0, 0)
+                _set_sid_mode(self._sidereal_mode, 0, 0)
                 # Ensure tidy acceleration is automatic (DE431)
-                swe.set_tid_acc(swe.TIDAL_AUTOMATIC)
+                _set_tid_acc(swe.TIDAL_AUTOMATIC)
             except Exception as e:
                 raise EphemerisError(f"Failed to initialize Swiss Ephemeris: {str(e)}")
-            
-        self._initialized = True
 
     def set_sidereal_mode(self, mode: SiderealMode, t0: float = 0.0, ayan_t0: float = 0.0):
         """
@@ -55,9 +214,20 @@ class Ephemeris:
         """
         with _SWISS_LOCK:
             self._sidereal_mode = mode
-            swe.set_sid_mode(mode, t0, ayan_t0)
+            _set_sid_mode(mode, t0, ayan_t0)
+
+    def use_sidereal_mode(self, mode: SiderealMode) -> None:
+        """
+        Select the sidereal mode for the calculations that follow. Protected by global lock.
+        Unlike set_sidereal_mode, re-selecting the active mode keeps the
+        t0/ayan_t0 it was set with; services that take a sidereal_mode go
+        through here.
+        """
+        with _SWISS_LOCK:
+            self._sidereal_mode = mode
+            _use_sid_mode(mode)
 
-    def calculate_planet(self, jd: float, planet: Planet, sidereal: bool = True, heliocentric: bool = False) -> Dict[str, float]:
+    def calculate_planet(self, jd: float, planet: Planet, sidereal: bool = True, heliocentric: bool = False) -> PlanetResult:
         """
         Calculate planet position.
         
@@ -74,8 +244,8 @@ class Ephemeris:
             
         Returns
         -------
-        Dict[str, float]
-            Dictionary containing longitude, latitude, distance, and speeds
+        PlanetResult
+            Longitude, latitude, distance, and speeds
             
         Raises
         ------
@@ -92,46 +262,139 @@ class Ephemeris:
         if planet not in ALLOWED_PLANETS:
             raise UnsupportedPlanetError(f"Planet ID {planet} is not in the allowed list for this engine.")
 
-        flags = DEFAULT_EPHE_FLAG | swe.FLG_SPEED
-        if sidereal:
-            flags |= swe.FLG_SIDEREAL
-        if heliocentric:
-            flags |= swe.FLG_HELCTR  # Heliocentric flag
+        flags = _calc_flags(sidereal, heliocentric)
             
         with _SWISS_LOCK:
             try:
-                xx, ret_flags = swe.calc_ut(jd, planet, flags)
-                
-                return {
-                    "longitude": xx[0],
-                    "latitude": xx[1],
-                    "distance": xx[2],
-                    "speed_long": xx[3],
-                    "speed_lat": xx[4],
-                    "speed_dist": xx[5]
-                }
+                return _calc_ut(jd, planet, flags)
             except Exception as e:
                 raise EphemerisError(f"Calculation failed for planet {planet}: {str(e)}")
 
-    def calculate_houses(self, jd: float, lat: float, lon: float, system: HouseSystem = HouseSystem.PLACIDUS, sidereal: bool = True):
+    def calculate_planets(self, jd: float, planets: Iterable[Planet], sidereal: bool = True, heliocentric: bool = False) -> List[PlanetResult]:
+        """
+        Calculate several planets at the same Julian Day.
+        
+        Equivalent to calling `calculate_planet` for each planet, but the
+        planets are validated and the flags built once, and the global lock
+        is taken once for the whole batch.
+        
+        Parameters
+        ----------
+        jd : float
+            Julian Day (UT)
+        planets : Iterable[Planet]
+            Planets to calculate, in the order results should be returned
+        sidereal : bool, optional
+            Use sidereal zodiac (default: True)
+        heliocentric : bool, optional
+            Calculate from Sun's center (default: False)
+            
+        Returns
+        -------
+        List[PlanetResult]
+            One result per planet, as returned by `calculate_planet`
+            
+        Raises
+        ------
+        UnsupportedPlanetError
+            If any planet is not in ALLOWED_PLANETS
+        EphemerisError
+            If Swiss Ephemeris calculation fails
+        """
+        planets = tuple(planets)
+        for planet in planets:
+            if planet not in ALLOWED_PLANETS:
+                raise UnsupportedPlanetError(f"Planet ID {planet} is not in the allowed list for this engine.")
+
+        flags = _calc_flags(sidereal, heliocentric)
+        results = []
+        
+        with _SWISS_LOCK:
+            for planet in planets:
+                try:
+                    results.append(_calc_ut(jd, planet, flags))
+                except Exception as e:
+                    raise EphemerisError(f"Calculation failed for planet {planet}: {str(e)}")
+        return results
+
+    def calculate_planet_batch(self, jds: Iterable[float], planet: Planet, sidereal: bool = True, heliocentric: bool = False) -> List[PlanetResult]:
+        """
+        Calculate one planet at several Julian Days.
+
+        Equivalent to calling `calculate_planet` for each Julian Day, but the
+        planet is validated and the flags built once, and the global lock
+        is taken once for the whole batch. Intended for the broad scans in
+        the search services.
+
+        Parameters
+        ----------
+        jds : Iterable[float]
+            Julian Days (UT), in the order results should be returned
+        planet : Planet
+            Planet enum member
+        sidereal : bool, optional
+            Use sidereal zodiac (default: True)
+        heliocentric : bool, optional
+            Calculate from Sun's center (default: False)
+
+        Returns
+        -------
+        List[PlanetResult]
+            One result per Julian Day, as returned by `calculate_planet`
+
+        Raises
+        ------
+        UnsupportedPlanetError
+            If planet is not in ALLOWED_PLANETS
+        EphemerisError
+            If Swiss Ephemeris calculation fails
+        """
+        if planet not in ALLOWED_PLANETS:
+            raise UnsupportedPlanetError(f"Planet ID {planet} is not in the allowed list for this engine.")
+
+        flags = _calc_flags(sidereal, heliocentric)
+        results = []
+
+        with _SWISS_LOCK:
+            for jd in jds:
+                try:
+                    results.append(_calc_ut(jd, planet, flags))
+                except Exception as e:
+                    raise EphemerisError(f"Calculation failed for planet {planet}: {str(e)}")
+        return results
+
+    def calculate_houses(self, jd: float, lat: float, lon: float, system: HouseSystem = HouseSystem.PLACIDUS, sidereal: bool = True,
+                         sidereal_mode: Optional[SiderealMode] = None):
         """
         Calculate house cusps and ascendant. Protected by global lock.
+        If `sidereal_mode` is given it is applied inside the same critical
+        section, so the ayanamsa cannot be changed by another thread in between.
         """
         with _SWISS_LOCK:
+            if sidereal_mode is not None:
+                self._sidereal_mode = sidereal_mode
+                _use_sid_mode(sidereal_mode)
             try:
-                h_sys_code = system.value.encode('ascii')
-                cusps, ascmc = swe.houses(jd, lat, lon, h_sys_code)
+                cusps, ascmc = swe.houses(jd, lat, lon, _SYS_BYTES[system])
                 
-                ayanamsa = 0.0
-                if sidereal:
-                    ayanamsa = swe.get_ayanamsa_ut(jd)
-                    
+                if not sidereal:
+                    # swe.houses already returns tropical longitudes in 0 <= lon < 360
+                    return {
+                        "cusps": list(cusps),
+                        "ascendant": ascmc[0],
+                        "mc": ascmc[1],
+                        "armc": ascmc[2],
+                        "vertex": ascmc[3]
+                    }
+                
+                ayanamsa = _ayanamsa_ut(jd)
+                # Normalize once here so downstream models can assume 0 <= lon < 360
                 return {
-                    "cusps": [c - ayanamsa for c in cusps],
-                    "ascendant": ascmc[0] - ayanamsa,
-                    "mc": ascmc[1] - ayanamsa,
+                    "cusps": [(c - ayanamsa) % 360.0 for c in cusps],
+                    "ascendant": (ascmc[0] - ayanamsa) % 360.0,
+                    "mc": (ascmc[1] - ayanamsa) % 360.0,
                     "armc": ascmc[2],
-                    "vertex": ascmc[3] - ayanamsa
+                    "vertex": (ascmc[3] - ayanamsa) % 360.0
                 }
             except Exception as e:
                 raise EphemerisError(f"House calculation failed: {str(e)}")
@@ -167,6 +430,38 @@ class Ephemeris:
         """
         Calculate fixed star position.
         """
+        return self.calculate_fixed_stars(jd, (star_name,), sidereal)[0]
+
+    def calculate_fixed_stars(self, jd: float, star_names: Iterable[str], sidereal: bool = True) -> List[Dict[str, float]]:
+        """
+        Calculate several fixed stars at the same Julian Day.
+        
+        Equivalent to calling `calculate_fixed_star` for each star, but the
+        catalog check and flags are done once and the global lock is taken
+        once for the whole batch.
+        
+        Parameters
+        ----------
+        jd : float
+            Julian Day (UT)
+        star_names : Iterable[str]
+            Star names as accepted by swe.fixstar_ut, in the order results
+            should be returned
+        sidereal : bool, optional
+            Use sidereal zodiac (default: True)
+            
+        Returns
+        -------
+        List[Dict[str, float]]
+            One dictionary per star, as returned by `calculate_fixed_star`
+            
+        Raises
+        ------
+        ConfigurationError
+            If no star catalog is found in the ephemeris path
+        EphemerisError
+            If Swiss Ephemeris calculation fails
+        """
         flags = DEFAULT_EPHE_FLAG
         if sidereal:
             flags |= swe.FLG_SIDEREAL
@@ -182,23 +477,25 @@ class Ephemeris:
         if not found:
             raise ConfigurationError(f"Required star catalog file ({star_files}) not found in {self._ephe_path}")
 
+        results = []
         with _SWISS_LOCK:
-            try:
-                res = swe.fixstar_ut(star_name, jd, flags)
-                xx = res[0]
-                name = res[1]
-                
-                res_mag = swe.fixstar_mag(star_name)
-                mag = res_mag[0] if isinstance(res_mag, (tuple, list)) else res_mag
+            for star_name in star_names:
+                try:
+                    res = swe.fixstar_ut(star_name, jd, flags)
+                    xx = res[0]
+                    name = res[1]
+                    
+                    mag = _fixstar_mag(star_name)
+                except Exception as e:
+                    raise EphemerisError(f"Fixed star calculation failed for {star_name}: {str(e)}")
                 
-                return {
+                results.append({
                     "name": name,
                     "longitude": xx[0],
                     "latitude": xx[1],
                     "magnitude": mag
-                }
-            except Exception as e:
-                raise EphemerisError(f"Fixed star calculation failed for {star_name}: {str(e)}")
+                })
+        return results
 
     def get_sidereal_time(self, jd: float) -> float:
         """
@@ -218,12 +515,7 @@ class Ephemeris:
         """
         # Enforce search range limit if end date provided
         if jd_end is not None:
-            search_range = abs(jd_end - jd_start)
-            if search_range > MAX_SEARCH_DAYS:
-                raise SearchRangeTooLargeError(
-                    f"Search range of {search_range:.0f} days exceeds maximum allowed "
-                    f"({MAX_SEARCH_DAYS} days / ~{MAX_SEARCH_DAYS/365.25:.0f} years)"
-                )
+            _check_search_range(jd_start, jd_end)
         
         with _SWISS_LOCK:
             try:
@@ -247,12 +539,7 @@ class Ephemeris:
         """
         # Enforce search range limit if end date provided
         if jd_end is not None:
-            search_range = abs(jd_end - jd_start)
-            if search_range > MAX_SEARCH_DAYS:
-                raise SearchRangeTooLargeError(
-                    f"Search range of {search_range:.0f} days exceeds maximum allowed "
-                    f"({MAX_SEARCH_DAYS} days / ~{MAX_SEARCH_DAYS/365.25:.0f} years)"
-                )
+            _check_search_range(jd_start, jd_end)
         
         with _SWISS_LOCK:
             try:
@@ -265,6 +552,30 @@ class Ephemeris:
             except Exception as e:
                 raise EphemerisError(f"Lunar eclipse search failed: {str(e)}")
 
+    def search_solar_eclipses(self, jd_start: float, jd_end: float) -> List[Dict[str, float]]:
+        """
+        Find all solar eclipses with peak between jd_start and jd_end.
+        
+        :param jd_start: Starting Julian Day (UT)
+        :param jd_end: Ending Julian Day (UT)
+        :return: List of dicts as returned by `search_solar_eclipse`, in time order
+        :raises SearchRangeTooLargeError: If search range exceeds MAX_SEARCH_DAYS
+        """
+        _check_search_range(jd_start, jd_end)
+        return _search_eclipses(swe.sol_eclipse_when_glob, "Solar", jd_start, jd_end)
+
+    def search_lunar_eclipses(self, jd_start: float, jd_end: float) -> List[Dict[str, float]]:
+        """
+        Find all lunar eclipses with peak between jd_start and jd_end.
+        
+        :param jd_start: Starting Julian Day (UT)
+        :param jd_end: Ending Julian Day (UT)
+        :return: List of dicts as returned by `search_lunar_eclipse`, in time order
+        :raises SearchRangeTooLargeError: If search range exceeds MAX_SEARCH_DAYS
+        """
+        _check_search_range(jd_start, jd_end)
+        return _search_eclipses(swe.lun_eclipse_when, "Lunar", jd_start, jd_end)
+
     def calculate_nodes_and_apsides(self, jd: float, planet: Planet) -> Dict[str, Dict[str, float]]:
         """
         Calculate planetary nodes and apsides.
@@ -318,6 +629,60 @@ class Ephemeris:
                 event = "rise" if is_rise else "set"
                 raise EphemerisError(f"Failed to calculate {event} for {planet}: {str(e)}")
 
+    def calculate_horizon_events(
+        self,
+        jd: float,
+        lat: float,
+        lon: float,
+        alt: float = 0.0,
+        events: Iterable[Tuple[Planet, int]] = (),
+        atpress: float = 1013.25,
+        attemp: float = 15.0
+    ) -> List[Optional[float]]:
+        """
+        Calculate several rise/set/transit events for one place and start time.
+        
+        Equivalent to one `calculate_rise_set` call per event, but the global
+        lock is taken once for the whole batch.
+        
+        Parameters
+        ----------
+        jd : float
+            Julian Day (UT) to search from
+        lat, lon, alt : float
+            Geographic latitude, longitude (degrees) and altitude (meters)
+        events : Iterable[Tuple[Planet, int]]
+            (planet, rsmi) pairs, where rsmi is a swe.CALC_* event optionally
+            or'ed with swe.BIT_* modifiers (e.g. swe.CALC_RISE | swe.BIT_CIVIL_TWILIGHT)
+        atpress : float, optional
+            Atmospheric pressure in mbar (default: 1013.25)
+        attemp : float, optional
+            Atmospheric temperature in Celsius (default: 15.0)
+            
+        Returns
+        -------
+        List[Optional[float]]
+            One Julian Day (UT) per event, in order, or None where the event
+            does not occur (e.g. circumpolar)
+            
+        Raises
+        ------
+        EphemerisError
+            If Swiss Ephemeris calculation fails
+        """
+        flags = DEFAULT_EPHE_FLAG
+        geopos = (lon, lat, alt)
+        results = []
+        
+        with _SWISS_LOCK:
+            for planet, rsmi in events:
+                try:
+                    status, tret = swe.rise_trans(jd, int(planet), rsmi, geopos, atpress, attemp, flags)
+                except Exception as e:
+                    raise EphemerisError(f"Failed to calculate horizon event {rsmi} for {planet}: {str(e)}")
+                results.append(tret[0] if status == 0 else None)
+        return results
+
     def calculate_transit(
         self,
         jd: float,
@@ -446,7 +811,40 @@ class Ephemeris:
     ) -> Optional[float]:
         """
         Find the next stationary point (speed_long == 0).
-        Uses simple bisection to find the zero crossing of planetary speed.
+        Finds the zero crossing of planetary speed with a bracketing root finder.
+        See `calculate_station` for the direction of the station as well.
+        """
+        station = self.calculate_station(jd_start, planet, forward, max_days)
+        return None if station is None else station[0]
+
+    def calculate_station(
+        self,
+        jd_start: float,
+        planet: Planet,
+        forward: bool = True,
+        max_days: float = 180.0
+    ) -> Optional[Tuple[float, int]]:
+        """
+        Find the next stationary point and which way the planet turns there.
+        
+        Parameters
+        ----------
+        jd_start : float
+            Julian Day (UT) to search from
+        planet : Planet
+            Planet enum member
+        forward : bool, optional
+            Search forward in time (default: True)
+        max_days : float, optional
+            How far to search, in days (default: 180)
+            
+        Returns
+        -------
+        Optional[Tuple[float, int]]
+            (station_jd, direction), where direction is +1 for a retrograde
+            station (direct -> retrograde) and -1 for a direct station
+            (retrograde -> direct). None for the Sun and Moon, unsupported
+            bodies, or if no station is found within max_days.
         """
         if planet not in ALLOWED_PLANETS or planet in [Planet.SUN, Planet.MOON]:
             return None # Sun/Moon don't go retrograde
@@ -455,13 +853,13 @@ class Ephemeris:
         current_jd = jd_start
         
         # 1. Bracket the zero crossing
-        last_speed = self.calculate_planet(current_jd, planet)["speed_long"]
+        last_speed = self.calculate_planet(current_jd, planet).speed_long
         found = False
         
         for _ in range(int(max_days)):
             current_jd += step
             current_data = self.calculate_planet(current_jd, planet)
-            current_speed = current_data["speed_long"]
+            current_speed = current_data.speed_long
             
             if last_speed * current_speed <= 0:
                 found = True
@@ -470,19 +868,15 @@ class Ephemeris:
             
         if not found:
             return None
-            
-        # 2. Refine with bisection
-        t1 = current_jd - step
-        t2 = current_jd
         
-        for _ in range(20): # Precision ~0.1 seconds
-            tm = (t1 + t2) / 2.0
-            sm = self.calculate_planet(tm, planet)["speed_long"]
+        # last_speed is on the earlier side when searching forward and on the
+        # later side when searching backward
+        direction = 1 if (last_speed > 0) == forward else -1
             
-            if last_speed * sm <= 0:
-                t2 = tm
-            else:
-                t1 = tm
-                last_speed = sm
-                
-        return (t1 + t2) / 2.0
+        # 2. Refine the speed zero; 1e-6 days (~0.1 s) matches the precision
+        # of the fixed 20-step bisection used before
+        station_jd = find_root(
+            lambda jd: self.calculate_planet(jd, planet).speed_long,
+            current_jd - step, current_jd, last_speed, current_speed, xtol=1e-6
+        )
+        return station_jd, direction
@@ -2,6 +2,7 @@ import swisseph as swe
 from threading import Lock
 from .errors import EphemerisStateError
 from .constants import SiderealMode
+from .ephemeris import _SWISS_LOCK, _set_sid_mode, _set_tid_acc
 
 class EphemerisContext:
     """
@@ -21,7 +22,7 @@ class EphemerisContext:
         self._prev_tidal = None
 
     def __enter__(self):
-        with self._state_lock:
+        with self._state_lock, _SWISS_LOCK:
             # Save current state
             # Note: pyswisseph doesn't explicitly 'get' all state easily, 
             # so we must rely on our internal tracking or set them explicitly.
@@ -32,26 +33,27 @@ class EphemerisContext:
                 # We can't really "get" the current sidereal mode from swisseph, 
                 # so we assume the Ephemeris singleton or caller handles the "prev" if they care.
                 # For strictly isolated context, we just set it.
-                swe.set_sid_mode(self.sid_mode, 0, 0)
+                _set_sid_mode(self.sid_mode, 0, 0)
             
             if self.topo is not None:
                 swe.set_topo(self.topo[0], self.topo[1], self.topo[2])
                 
             if self.tidal is not None:
-                swe.set_tid_acc(self.tidal)
+                _set_tid_acc(self.tidal)
                 
             return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         # In a real enterprise SDK, we would restore the "Global Default" here.
         # Since we are hardening, we will restore things to "TIDAL_AUTOMATIC" etc. if they were changed.
-        if self.tidal is not None:
-            swe.set_tid_acc(swe.TIDAL_AUTOMATIC)
-        
-        # Restore sidereal mode to Lahiri (project policy) if it was changed
-        if self.sid_mode is not None:
-            swe.set_sid_mode(SiderealMode.LAHIRI, 0, 0)
-        
-        # Reset topo if it was changed (return to geocentric)
-        if self.topo is not None:
-            swe.set_topo(0, 0, 0) # Back to geocentric center
+        with _SWISS_LOCK:
+            if self.tidal is not None:
+                _set_tid_acc(swe.TIDAL_AUTOMATIC)
+            
+            # Restore sidereal mode to Lahiri (project policy) if it was changed
+            if self.sid_mode is not None:
+                _set_sid_mode(SiderealMode.LAHIRI, 0, 0)
+            
+            # Reset topo if it was changed (return to geocentric)
+            if self.topo is not None:
+                swe.set_topo(0, 0, 0) # Back to geocentric center
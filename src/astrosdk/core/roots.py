@@ -0,0 +1,119 @@
+from typing import Callable, Optional
+
+
+def find_root(f: Callable[[float], float], a: float, b: float,
+              fa: Optional[float] = None, fb: Optional[float] = None,
+              xtol: float = 1e-7, maxiter: int = 100) -> float:
+    """
+    Find a root of `f` inside the bracket [a, b] with Brent's method.
+
+    Inverse quadratic interpolation (or a secant step) is tried first and
+    bisection is used whenever that step is not safe, so convergence is
+    never slower than bisection but usually takes 6-10 evaluations of `f`
+    where bisection takes ~25. Meant for the refinement step of the search
+    services, where every evaluation is an ephemeris call.
+
+    Parameters
+    ----------
+    f : Callable[[float], float]
+        Function of a Julian Day, continuous on the bracket
+    a, b : float
+        Bracket ends; f(a) and f(b) must have opposite signs
+    fa, fb : float, optional
+        Already known values of f(a) and f(b), to save evaluations
+    xtol : float, optional
+        Absolute tolerance on the root (default: 1e-7 days, ~9 ms)
+    maxiter : int, optional
+        Maximum number of Brent iterations (default: 100). If they run out,
+        which takes a root of high odd multiplicity, the remaining bracket
+        is bisected down to `xtol`, so the result is still within it
+
+    Returns
+    -------
+    float
+        The root, within `xtol`. Always taken from the `b` side of the
+        final bracket (f has the sign of f(b) there, or is zero), so a
+        crossing found this way has already happened at the returned time.
+
+    Raises
+    ------
+    ValueError
+        If f(a) and f(b) do not have opposite signs
+    """
+    if fa is None:
+        fa = f(a)
+    if fb is None:
+        fb = f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if (fa < 0) == (fb < 0):
+        raise ValueError("Root is not bracketed")
+    b_negative = fb < 0
+
+    # Port of the classic zeroin/brentq iteration: xcur is the best estimate,
+    # xblk the opposite end of the bracket, xpre the previous estimate.
+    xpre, fpre = a, fa
+    xcur, fcur = b, fb
+    xblk, fblk = 0.0, 0.0
+    spre = scur = 0.0
+    delta = xtol / 2
+
+    for _ in range(maxiter):
+        if (fpre < 0) != (fcur < 0):
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        sbis = (xblk - xcur) / 2
+        if fcur == 0 or abs(sbis) < delta:
+            break
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # Secant
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # Inverse quadratic interpolation
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre, scur = scur, stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+
+        xpre, fpre = xcur, fcur
+        if abs(scur) > delta:
+            xcur += scur
+        else:
+            xcur += delta if sbis > 0 else -delta
+        fcur = f(xcur)
+    else:
+        # Out of iterations: finish the current bracket by bisection
+        if fcur != 0:
+            if (fpre < 0) != (fcur < 0):
+                xblk, fblk = xpre, fpre
+            while abs(xblk - xcur) >= xtol:
+                xmid = (xblk + xcur) / 2
+                if xmid == xblk or xmid == xcur:
+                    break  # xtol is below the float spacing here
+                fmid = f(xmid)
+                if fmid == 0:
+                    return xmid
+                if (fmid < 0) == (fcur < 0):
+                    xcur, fcur = xmid, fmid
+                else:
+                    xblk, fblk = xmid, fmid
+
+    # xcur and xblk bracket the root on exit
+    if fcur == 0 or (fcur < 0) == b_negative:
+        return xcur
+    if (fblk < 0) == b_negative:
+        return xblk
+    return xpre
@@ -0,0 +1,58 @@
+import itertools
+from typing import Iterator, Optional, Tuple
+from .ephemeris import Ephemeris, PlanetResult
+from .constants import Planet, SCAN_BATCH_SIZE, DEFAULT_SCAN_STEP_DAYS
+
+
+def time_grid(jd_start: float, jd_end: float, step_days: float) -> Iterator[float]:
+    """
+    Yield Julian Days from jd_start in steps of step_days, the last step
+    clamped to jd_end. The grid the broad scans sample before refining.
+    """
+    jd = jd_start
+    yield jd
+    while jd < jd_end:
+        jd = min(jd + step_days, jd_end)
+        yield jd
+
+
+def scan_positions(eph: Ephemeris, planet: Planet, jd_start: float, jd_end: float,
+                   step_days: float, sidereal: bool = True,
+                   heliocentric: bool = False) -> Iterator[Tuple[float, PlanetResult]]:
+    """
+    Yield (jd, position) on time_grid(jd_start, jd_end, step_days). Points
+    are fetched SCAN_BATCH_SIZE at a time, so memory and the time each batch
+    holds the ephemeris lock stay bounded however long the range.
+    """
+    points = time_grid(jd_start, jd_end, step_days)
+    while grid := list(itertools.islice(points, SCAN_BATCH_SIZE)):
+        batch = eph.calculate_planet_batch(grid, planet, sidereal=sidereal, heliocentric=heliocentric)
+        yield from zip(grid, batch, strict=True)
+
+
+def scan_longitudes(eph: Ephemeris, planet: Planet, jd_start: float, jd_end: float,
+                    step_days: float, heliocentric: bool = False) -> Iterator[Tuple[float, float]]:
+    """
+    Yield (jd, longitude) on a grid from jd_start to jd_end, the last step
+    clamped to jd_end. Points are fetched SCAN_BATCH_SIZE at a time, so a
+    caller that stops early doesn't pay for the whole window.
+
+    Wherever the speed changes sign between two grid points the interval is
+    re-sampled at DEFAULT_SCAN_STEP_DAYS, since a station inside a coarse
+    step can hide a pair of crossings.
+    """
+    last_jd: Optional[float] = None
+    last_speed: Optional[float] = None
+    for grid_jd, pos in scan_positions(eph, planet, jd_start, jd_end, step_days, heliocentric=heliocentric):
+        speed = pos.speed_long
+        if last_jd is not None and last_speed is not None and (speed < 0) != (last_speed < 0) and step_days > DEFAULT_SCAN_STEP_DAYS:
+            fine = []
+            fine_jd = last_jd + DEFAULT_SCAN_STEP_DAYS
+            while fine_jd < grid_jd:
+                fine.append(fine_jd)
+                fine_jd += DEFAULT_SCAN_STEP_DAYS
+            fine_batch = eph.calculate_planet_batch(fine, planet, sidereal=True, heliocentric=heliocentric)
+            for fine_jd, fine_pos in zip(fine, fine_batch, strict=True):
+                yield fine_jd, fine_pos.longitude
+        yield grid_jd, pos.longitude
+        last_jd, last_speed = grid_jd, speed
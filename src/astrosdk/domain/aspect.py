@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from ..core.constants import Planet
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Aspect:
     p1: Planet
     p2: Planet
@@ -1,17 +1,18 @@
+import math
 from dataclasses import dataclass
 from typing import List
-from ..core.constants import HouseSystem, ZodiacSign
+from ..core.constants import HouseSystem, ZodiacSign, _ZODIAC_BY_INDEX, _INV_30
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HouseCusp:
     number: int
     longitude: float
 
     @property
     def sign(self) -> ZodiacSign:
-        return ZodiacSign(int(self.longitude / 30))
+        return _ZODIAC_BY_INDEX[math.floor(self.longitude * _INV_30) % 12]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HouseAxes:
     ascendant: float
     midheaven: float
@@ -19,7 +20,7 @@ class HouseAxes:
     imum_coeli: float
     vertex: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChartHouses:
     system: HouseSystem
     cusps: List[HouseCusp]
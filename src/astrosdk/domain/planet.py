@@ -1,9 +1,18 @@
-from dataclasses import dataclass
-from typing import Optional
-from ..core.constants import Planet, ZodiacSign
+import math
+from dataclasses import dataclass, fields
+from typing import Any, List, Optional
+from ..core.constants import Planet, ZodiacSign, _ZODIAC_BY_INDEX, _INV_30
 
-@dataclass(frozen=True)
-class PlanetPosition:
+class _SignSlots:
+    # Storage for the values PlanetPosition derives from its longitude.
+    # Declared on a plain base class so they stay out of the dataclass
+    # fields, and so out of asdict()/astuple() and the generated __init__.
+    __slots__ = ("sign", "sign_degree")
+    sign: ZodiacSign
+    sign_degree: float
+
+@dataclass(frozen=True, slots=True)
+class PlanetPosition(_SignSlots):
     planet: Planet
     longitude: float
     latitude: float
@@ -14,14 +23,17 @@ class PlanetPosition:
     # Local horizontal coordinates (optional)
     azimuth: Optional[float] = None
     altitude: Optional[float] = None
-    
-    @property
-    def sign(self) -> ZodiacSign:
-        return ZodiacSign(int(self.longitude / 30))
 
-    @property
-    def sign_degree(self) -> float:
-        return self.longitude % 30.0
+    def __post_init__(self) -> None:
+        # Derived from longitude once at construction; the instance is frozen.
+        object.__setattr__(self, "sign", _ZODIAC_BY_INDEX[math.floor(self.longitude * _INV_30) % 12])
+        object.__setattr__(self, "sign_degree", self.longitude % 30.0)
+
+    def __setstate__(self, state: List[Any]) -> None:
+        # Pickle and copy restore only the fields, so derive the rest again
+        for f, value in zip(fields(self), state, strict=True):
+            object.__setattr__(self, f.name, value)
+        self.__post_init__()
 
     @property
     def is_retrograde(self) -> bool:
@@ -41,7 +53,7 @@ class PlanetPosition:
     def zenith_distance(self) -> Optional[float]:
         """Angle from zenith (90 - altitude)."""
         return 90.0 - self.altitude if self.altitude is not None else None
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanetaryPhenomena:
     planet: Planet
     phase_angle: float        # angle between sun and earth as seen from planet
@@ -50,7 +62,7 @@ class PlanetaryPhenomena:
     apparent_diameter: float  # apparent diameter of disc
     apparent_magnitude: float # apparent magnitude
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FixedStarPosition:
     name: str
     longitude: float
@@ -59,7 +71,7 @@ class FixedStarPosition:
     
     @property
     def sign(self) -> ZodiacSign:
-        return ZodiacSign(int(self.longitude / 30))
+        return _ZODIAC_BY_INDEX[math.floor(self.longitude * _INV_30) % 12]
 
     @property
     def sign_degree(self) -> float:
@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from typing import List, Dict, Optional
 from ..core.time import Time
 from ..core.ephemeris import Ephemeris
@@ -13,6 +12,8 @@ class ChartEngine:
     High-level API for generating full Chart objects.
     Orchestrates NatalService and any future services.
     """
+    __slots__ = ("_ephemeris", "_natal_service")
+
     def __init__(self):
         self._ephemeris = Ephemeris()
         self._natal_service = NatalService(self._ephemeris)
@@ -26,8 +27,7 @@ class ChartEngine:
         """
         Generate a complete Astrological Chart.
         """
-        planets = self._natal_service.calculate_positions(time, sidereal_mode)
-        houses = self._natal_service.calculate_houses(time, lat, lon, system, sidereal_mode)
+        planets, houses = self._natal_service.calculate_chart_data(time, lat, lon, system, sidereal_mode)
         
         return Chart(
             metadata={
@@ -1,15 +1,24 @@
+from typing import Tuple
+import functools
 import swisseph as swe
 from ..core.constants import DEFAULT_SIDEREAL, DEFAULT_EPHE_FLAG
 
+@functools.cache
+def _library_info() -> Tuple[str, str]:
+    # Fixed for the lifetime of the process; tidal acceleration is not, since
+    # EphemerisContext can override it, so it is still read on every call.
+    return swe.version, swe.get_library_path()
+
 def get_engine_metadata():
     """
     Expose runtime environment and engine configuration.
     """
+    version, library_path = _library_info()
     return {
-        "pyswisseph_version": swe.version(),
+        "pyswisseph_version": version,
         "de_number": swe.DE_NUMBER,
         "tidal_acceleration": swe.get_tid_acc(),
-        "ephemeris_path": swe.get_library_path(),
+        "ephemeris_path": library_path,
         "sidereal_default": DEFAULT_SIDEREAL.name,
         "default_ephemeris": "Swiss Ephemeris" if DEFAULT_EPHE_FLAG == 2 else "JPL Ephemeris",
         "starfile": "fixstars.cat" # Swiss default
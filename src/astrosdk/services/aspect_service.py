@@ -1,7 +1,10 @@
-from typing import List, Optional
+import functools
+import math
+from typing import Dict, List, Optional, Tuple
 from ..domain.planet import PlanetPosition
 from ..domain.aspect import Aspect
 from ..core.constants import Planet
+from ..core.angles import wrap180
 
 class AspectService:
     """
@@ -116,33 +119,14 @@ class AspectService:
         if aspect_types is None:
             aspect_types = ['major']  # Default to major aspects only
         
-        # Build the aspect angles to check based on requested types
-        angles_to_check = {}
-        if 'all' in aspect_types:
-            angles_to_check = self.ASPECT_ANGLES
-        else:
-            if 'major' in aspect_types:
-                angles_to_check.update(self.MAJOR_ASPECTS)
-            if 'minor' in aspect_types:
-                angles_to_check.update(self.MINOR_ASPECTS)
-            if 'kepler' in aspect_types:
-                angles_to_check.update(self.KEPLER_ASPECTS)
-            if 'septile' in aspect_types:
-                angles_to_check.update(self.SEPTILE_ASPECTS)
-            if 'novile' in aspect_types:
-                angles_to_check.update(self.NOVILE_ASPECTS)
-            if 'undecile' in aspect_types:
-                angles_to_check.update(self.UNDECILE_ASPECTS)
-        
-        # Merge custom orbs with defaults
-        orbs = self.DEFAULT_ORBS.copy()
-        if custom_orbs:
-            orbs.update(custom_orbs)
+        table = self._compile(aspect_types, custom_orbs)
+        # Read each planet's coordinates once rather than once per pair
+        coords = [(p.planet, p.longitude, p.speed_long) for p in planets]
         
         results = []
-        for i, p1 in enumerate(planets):
-            for p2 in planets[i+1:]:
-                aspect = self.get_aspect(p1, p2, angles_to_check, orbs)
+        for i, (planet1, lon1, speed1) in enumerate(coords):
+            for planet2, lon2, speed2 in coords[i+1:]:
+                aspect = _match_aspect(planet1, lon1, speed1, planet2, lon2, speed2, table)
                 if aspect:
                     results.append(aspect)
         return results
@@ -165,61 +149,113 @@ class AspectService:
             angles_to_check = self.ASPECT_ANGLES
         if orbs is None:
             orbs = self.DEFAULT_ORBS
+        
+        return _match_aspect(p1.planet, p1.longitude, p1.speed_long,
+                             p2.planet, p2.longitude, p2.speed_long,
+                             _aspect_table(angles_to_check, orbs))
+
+    @classmethod
+    def _compile(cls, aspect_types: List[str], custom_orbs: Optional[Dict[str, float]]) -> "_AspectTable":
+        """
+        Resolve aspect family filters and orb overrides into an aspect table.
+        Memoized on the (hashable) arguments, so repeated scans with the same
+        settings skip the setup entirely.
+        """
+        # A single filter passed as a bare string is one family, not its letters
+        types = (aspect_types,) if isinstance(aspect_types, str) else tuple(aspect_types)
+        orb_items = tuple(custom_orbs.items()) if custom_orbs else ()
+        return cls._compile_cached(types, orb_items)
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _compile_cached(cls, aspect_types: Tuple[str, ...], orb_items: Tuple[Tuple[str, float], ...]) -> "_AspectTable":
+        # Select rows from the master table with a bitmask of requested families
+        if 'all' in aspect_types:
+            mask = _ALL_FAMILIES
+        else:
+            mask = 0
+            for aspect_type in aspect_types:
+                mask |= _FAMILY_BITS.get(aspect_type, 0)
+        
+        # Merge custom orbs with defaults
+        orbs = cls.DEFAULT_ORBS.copy()
+        if orb_items:
+            orbs.update(orb_items)
+        
+        return tuple((angle, orbs.get(name, 0.0), name)
+                     for bit, angle, name in cls._master_table() if bit & mask)
+
+    @classmethod
+    def _master_table(cls) -> Tuple[Tuple[int, float, str], ...]:
+        """
+        Every aspect as a (family bit, angle, name) row, families in _FAMILY_BITS order.
+        """
+        families = (cls.MAJOR_ASPECTS, cls.MINOR_ASPECTS, cls.KEPLER_ASPECTS,
+                    cls.SEPTILE_ASPECTS, cls.NOVILE_ASPECTS, cls.UNDECILE_ASPECTS)
+        return tuple((1 << i, angle, name)
+                     for i, family in enumerate(families)
+                     for angle, name in family.items())
+
+
+# One bit per aspect family, in the order families are tried
+_FAMILY_BITS = {
+    'major': 1 << 0,
+    'minor': 1 << 1,
+    'kepler': 1 << 2,
+    'septile': 1 << 3,
+    'novile': 1 << 4,
+    'undecile': 1 << 5
+}
+_ALL_FAMILIES = (1 << len(_FAMILY_BITS)) - 1
+
+# (angle, orb, name) rows in the order aspects are tried
+_AspectTable = Tuple[Tuple[float, float, str], ...]
+
+def _aspect_table(angles_to_check: Dict[float, str], orbs: Dict[str, float]) -> _AspectTable:
+    return tuple((angle, orbs.get(name, 0.0), name) for angle, name in angles_to_check.items())
+
+
+def _match_aspect(planet1: Planet, lon1: float, speed1: float,
+                  planet2: Planet, lon2: float, speed2: float,
+                  table: _AspectTable) -> Optional[Aspect]:
+    """
+    Return the first aspect in `table` that the two longitudes form within
+    orb, or None.
+    """
+    # Shortest arc between the two longitudes, in [0, 180]
+    diff = 180.0 - abs(abs(lon1 - lon2) - 180.0)
+        
+    for angle, orb_limit, name in table:
+        actual_orb = abs(diff - angle)
+        
+        if actual_orb <= orb_limit:
+            # Determine applying/separating based on relative velocity
+            # An aspect is "applying" if the planets are moving closer to exactitude
+            # An aspect is "separating" if the planets are moving away from exactitude
+            
+            # Calculate the rate of change of the aspect angle
+            # If the faster planet is "catching up" to form the aspect, it's applying
+            # If the faster planet is "moving away" from the aspect, it's separating
+            
+            # Normalize the angular difference to -180 to 180
+            angular_diff = wrap180(lon2 - lon1)
             
-        diff = abs(p1.longitude - p2.longitude)
-        if diff > 180:
-            diff = 360 - diff
+            # Relative speed (how fast p2 is moving relative to p1)
+            relative_speed = speed2 - speed1
             
-        for angle, name in angles_to_check.items():
-            orb_limit = orbs.get(name, 0.0)
-            actual_orb = abs(diff - angle)
+            # The orb is |angular_diff - target|, where target is the aspect
+            # angle on the same side as angular_diff (0 for a conjunction).
+            # It is shrinking, i.e. applying, when the offset from target and
+            # the relative speed have opposite signs.
+            offset = angular_diff - math.copysign(angle, angular_diff)
+            is_applying = offset * relative_speed < 0
             
-            if actual_orb <= orb_limit:
-                # Determine applying/separating based on relative velocity
-                # An aspect is "applying" if the planets are moving closer to exactitude
-                # An aspect is "separating" if the planets are moving away from exactitude
-                
-                # Calculate the rate of change of the aspect angle
-                # If the faster planet is "catching up" to form the aspect, it's applying
-                # If the faster planet is "moving away" from the aspect, it's separating
-                
-                # Normalize the angular difference to -180 to 180
-                angular_diff = (p2.longitude - p1.longitude + 180) % 360 - 180
-                
-                # Relative speed (how fast p2 is moving relative to p1)
-                relative_speed = p2.speed_long - p1.speed_long
-                
-                # For each aspect type, determine if we're approaching or separating
-                # The aspect is applying if the relative motion reduces the orb
-                if angle == 0.0:  # Conjunction
-                    # Moving toward 0° separation
-                    is_applying = (angular_diff > 0 and relative_speed < 0) or \
-                                  (angular_diff < 0 and relative_speed > 0)
-                elif angle == 180.0:  # Opposition
-                    # Moving toward 180° separation
-                    if angular_diff > 0:
-                        is_applying = relative_speed < 0 and angular_diff < 180
-                    else:
-                        is_applying = relative_speed > 0 and angular_diff > -180
-                else:  # Other aspects (60, 90, 120)
-                    # Check if relative motion is reducing the orb
-                    # If angular_diff is close to +angle, and relative_speed is negative, applying
-                    # If angular_diff is close to -angle, and relative_speed is positive, applying
-                    target_angle = angle if angular_diff > 0 else -angle
-                    distance_to_exact = abs(angular_diff) - angle
-                    
-                    # If distance is decreasing, it's applying
-                    if angular_diff > 0:
-                        is_applying = relative_speed < 0
-                    else:
-                        is_applying = relative_speed > 0
-                
-                return Aspect(
-                    p1=p1.planet,
-                    p2=p2.planet,
-                    angle=diff,
-                    orb=actual_orb,
-                    type=name,
-                    applying=is_applying
-                )
-        return None
+            return Aspect(
+                p1=planet1,
+                p2=planet2,
+                angle=diff,
+                orb=actual_orb,
+                type=name,
+                applying=is_applying
+            )
+    return None
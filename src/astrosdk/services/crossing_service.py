@@ -1,9 +1,29 @@
 from typing import Tuple, Optional, List
+import functools
 import math
 from ..core.ephemeris import Ephemeris
 from ..core.time import Time
-from ..core.constants import Planet, SiderealMode
+from ..core.constants import Planet, SiderealMode, SCAN_STEP_DAYS, DEFAULT_SCAN_STEP_DAYS, _INV_30
 from ..core.errors import EphemerisError
+from ..core.angles import wrap180
+from ..core.roots import find_root
+from ..core.scan import scan_longitudes
+
+# Bodies whose geocentric longitude only ever increases
+_ALWAYS_DIRECT = (Planet.SUN, Planet.MOON)
+_NEWTON_MAX_ITER = 20
+_INGRESS_EPSILON_SECONDS = 1.0 # Matches find_planetary_return's default tolerance
+
+
+def _signed_diff(eph: Ephemeris, jd: float, planet: Planet, target_longitude: float,
+                 heliocentric: bool = False) -> float:
+    """
+    Signed angular distance of the planet from target_longitude at jd, in
+    [-180, 180), so the 360/0 wraparound reads as a sign change.
+    """
+    pos = eph.calculate_planet(jd, planet, sidereal=True, heliocentric=heliocentric)
+    return wrap180(pos.longitude - target_longitude)
+
 
 class CrossingService:
     """
@@ -48,81 +68,100 @@ class CrossingService:
         Time
             The exact time of the return
         """
-        self.eph.set_sidereal_mode(sidereal_mode)
+        self.eph.use_sidereal_mode(sidereal_mode)
+        
+        # Sun and Moon never retrograde geocentrically, so Newton's method on
+        # the ephemeris speed converges in a handful of calls
+        if not heliocentric and planet in _ALWAYS_DIRECT:
+            jd = self._newton_return(
+                planet, target_longitude, start_time.julian_day,
+                start_time.julian_day + max_search_years * 365.25,
+                tolerance_seconds / 86400.0
+            )
+            if jd is not None:
+                return Time.from_julian_day(jd)
         
-        # Binary search for the moment
         # Initial bounds: start_time to start_time + max_search_years
         jd_start = start_time.julian_day
         # Estimate daily motion to find a narrow window first
         # Sun: ~1 deg/day, Moon: ~13 deg/day
         
-        # For now, let's use a robust iterative refinement
-        t_current = jd_start
         # Search range in days
         limit_days = max_search_years * 365.25
         
         # 1. Broad search: Find the window where the planet crosses the target
         # We step through time and check for crossing
-        step_days = 0.5 # Default broad step
-        if planet == Planet.MOON:
-            step_days = 0.1 # Moon is faster
+        step_days = SCAN_STEP_DAYS.get(planet, DEFAULT_SCAN_STEP_DAYS)
             
         jd_low = jd_start
         jd_high = jd_start + limit_days
         
-        last_diff = None
+        last_jd: Optional[float] = None
+        last_diff: Optional[float] = None
         found_window = False
         
-        # We need to handle the 360/0 wraparound
-        def get_diff(jd):
-            pos = self.eph.calculate_planet(jd, planet, sidereal=True, heliocentric=heliocentric)
-            lon = pos["longitude"]
-            diff = (lon - target_longitude + 180) % 360 - 180
-            return diff
-
         # Search for crossing
-        curr_jd = jd_start
-        while curr_jd < jd_high:
-            diff = get_diff(curr_jd)
-            if last_diff is not None:
+        for jd, lon in scan_longitudes(self.eph, planet, jd_low, jd_high, step_days, heliocentric):
+            diff = wrap180(lon - target_longitude)
+            if last_jd is not None and last_diff is not None:
                 # We only care about crossings where the current diff is near zero
                 # and transitioned through it. Modulo wrap at 180/-180 also flips sign,
                 # so we check that we are in the "front half" of the circle relative to target.
                 if abs(diff) < 90 and abs(last_diff) < 90:
                     if (last_diff < 0 and diff >= 0) or (last_diff > 0 and diff <= 0):
-                        # Crossing found between curr_jd - step_days and curr_jd
-                        jd_low = curr_jd - step_days
-                        jd_high = curr_jd
+                        # Crossing found between the previous grid point and jd
+                        jd_low = last_jd
+                        jd_high = jd
                         found_window = True
                         break
+            last_jd = jd
             last_diff = diff
-            curr_jd += step_days
             
         if not found_window:
             raise EphemerisError(f"Could not find return for {planet.name} within {max_search_years} years.")
+        assert last_diff is not None  # set on every pass that can find the window
             
-        # 2. Refine window (Binary search)
+        # 2. Refine window
         # tolerance in JD units (1 second = 1 / 86400 days)
         tol_jd = tolerance_seconds / 86400.0
         
-        while (jd_high - jd_low) > tol_jd:
-            mid = (jd_low + jd_high) / 2.0
-            diff = get_diff(mid)
-            
-            # Since we found a crossing, we know the signs of last_diff was different
-            # We need to know if it's direct or retrograde to know which way to go
-            # But get_diff already tells us the "signed distance"
-            
-            # Let's check start diff
-            low_diff = get_diff(jd_low)
-            if (low_diff < 0 and diff > 0) or (low_diff > 0 and diff < 0):
-                jd_high = mid
-            else:
-                jd_low = mid
-                
-        final_jd = (jd_low + jd_high) / 2.0
+        # The scan stopped with last_diff/diff holding the values at the
+        # bracket ends, so the root finder doesn't need to recompute them
+        final_jd = find_root(
+            functools.partial(_signed_diff, self.eph, planet=planet, target_longitude=target_longitude, heliocentric=heliocentric),
+            jd_low, jd_high, last_diff, diff, xtol=tol_jd
+        )
         return Time.from_julian_day(final_jd)
 
+    def _newton_return(self, planet: Planet, target_longitude: float, jd_start: float,
+                       jd_limit: float, tol_jd: float) -> Optional[float]:
+        """
+        Solve longitude(jd) == target_longitude for a body with positive speed,
+        using the ephemeris speed as the derivative.
+        Returns None if it does not converge inside [jd_start, jd_limit], in which
+        case the caller falls back to the scan and bisection.
+        """
+        pos = self.eph.calculate_planet(jd_start, planet, sidereal=True)
+        if pos.speed_long <= 0:
+            return None
+        # First guess: the forward arc still to travel at the current speed
+        jd = jd_start + ((target_longitude - pos.longitude) % 360.0) / pos.speed_long
+        
+        for _ in range(_NEWTON_MAX_ITER):
+            pos = self.eph.calculate_planet(jd, planet, sidereal=True)
+            if pos.speed_long <= 0:
+                return None
+            step = wrap180(pos.longitude - target_longitude) / pos.speed_long
+            jd -= step
+            if abs(step) < tol_jd:
+                break
+        else:
+            return None
+        
+        if jd < jd_start or jd > jd_limit:
+            return None
+        return jd
+
     def find_solar_return(self, natal_sun_longitude: float, year: int, sidereal_mode: SiderealMode = SiderealMode.LAHIRI) -> Time:
         """Find solar return for a given year."""
         from datetime import datetime, timezone, timedelta
@@ -130,6 +169,32 @@ class CrossingService:
         start_search = Time(datetime(year, 1, 1, 0, 0, tzinfo=timezone.utc) - timedelta(days=10))
         return self.find_planetary_return(Planet.SUN, natal_sun_longitude, start_search, sidereal_mode=sidereal_mode, max_search_years=1.2)
 
+    def find_solar_returns_range(self, natal_sun_longitude: float, year_start: int, year_end: int, sidereal_mode: SiderealMode = SiderealMode.LAHIRI) -> List[Time]:
+        """
+        Find the solar returns for every year from year_start to year_end
+        (inclusive), the same as calling find_solar_return once per year.
+
+        Each return after the first is searched for in a narrow window just
+        short of a year after the previous one, instead of from scratch.
+        """
+        from datetime import datetime, timezone, timedelta
+        if year_end < year_start:
+            return []
+
+        returns = [self.find_solar_return(natal_sun_longitude, year_start, sidereal_mode)]
+        for year in range(year_start + 1, year_end + 1):
+            prev_jd = returns[-1].julian_day
+            year_search = Time(datetime(year, 1, 1, 0, 0, tzinfo=timezone.utc) - timedelta(days=10))
+            if prev_jd + 363.0 < year_search.julian_day:
+                # Previous return fell right at the start of its search window,
+                # so this one may fall before the year's window opens
+                returns.append(self.find_solar_return(natal_sun_longitude, year, sidereal_mode))
+                continue
+            # Returns are ~365.25 days apart, so a week-long window is enough
+            start = Time.from_julian_day(prev_jd + 363.0)
+            returns.append(self.find_planetary_return(Planet.SUN, natal_sun_longitude, start, sidereal_mode=sidereal_mode, max_search_years=0.02))
+        return returns
+
     def find_lunar_return(self, natal_moon_longitude: float, start_time: Time, sidereal_mode: SiderealMode = SiderealMode.LAHIRI) -> Time:
         """Find next lunar return after start_time."""
         return self.find_planetary_return(Planet.MOON, natal_moon_longitude, start_time, sidereal_mode=sidereal_mode, max_search_years=0.1)
@@ -150,23 +215,32 @@ class CrossingService:
             (Time of ingress, Sign number 1-12)
         """
         # 1. Current position
-        self.eph.set_sidereal_mode(sidereal_mode)
+        self.eph.use_sidereal_mode(sidereal_mode)
         pos = self.eph.calculate_planet(start_time.julian_day, planet, sidereal=True, heliocentric=heliocentric)
-        curr_lon = pos["longitude"]
+        curr_lon = pos.longitude
         
         # 2. Find target ingress longitude
         # If moving direct, target is next 30 deg boundary
         # If moving retrograde, target is previous 30 deg boundary
-        speed = pos["speed_long"]
+        speed = pos.speed_long
         
         if speed >= 0:
-            target_lon = (math.floor(curr_lon / 30.0) + 1) * 30.0
+            target_lon = (math.floor(curr_lon * _INV_30) + 1) * 30.0
             if target_lon >= 360: target_lon = 0
         else:
-            target_lon = math.floor(curr_lon / 30.0) * 30.0
+            target_lon = math.floor(curr_lon * _INV_30) * 30.0
             if target_lon < 0: target_lon = 330
             
-        # 3. Use find_planetary_return to get exact time
+        # Sign number: 1=Aries, 2=Taurus...
+        sign_num = int((target_lon * _INV_30) % 12) + 1
+        
+        # 3. Already within a second of the boundary being approached (e.g.
+        # when chaining ingress searches): the search would only return
+        # start_time again, so skip it
+        if speed != 0 and 0 <= wrap180(target_lon - curr_lon) / speed * 86400.0 < _INGRESS_EPSILON_SECONDS:
+            return start_time, sign_num
+        
+        # 4. Use find_planetary_return to get exact time
         ingress_time = self.find_planetary_return(
             planet, 
             target_lon, 
@@ -176,8 +250,4 @@ class CrossingService:
             max_search_years=0.5 if planet != Planet.PLUTO else 40.0 # Pluto is slow
         )
         
-        # 4. Determine which sign it entered
-        # Sign number: 1=Aries, 2=Taurus...
-        sign_num = int((target_lon / 30.0) % 12) + 1
-        
         return ingress_time, sign_num
@@ -1,7 +1,10 @@
-from typing import List
+from typing import List, Optional
 from ..core.ephemeris import Ephemeris
 from ..core.time import Time
-from ..core.constants import Planet
+from ..core.constants import Planet, SCAN_STEP_DAYS, DEFAULT_SCAN_STEP_DAYS
+from ..core.angles import wrap180
+from ..core.roots import find_root
+from ..core.scan import scan_longitudes
 from ..domain.cycle import CycleEvent, CycleConfig
 
 class CycleService:
@@ -17,50 +20,47 @@ class CycleService:
         Uses a fixed search window and bisection refinement.
         """
         jd_start = start_time.julian_day
-        # Rough step for discovery (Solar return vs Moon return)
+        # Per-body step for discovery (see SCAN_STEP_DAYS)
         # We search from start_time forward.
         
-        step = 0.5 # 12 hours check
+        step = SCAN_STEP_DAYS.get(planet, DEFAULT_SCAN_STEP_DAYS)
         current_jd = jd_start
         end_jd = jd_start + window_days # Default search window
         
-        pos = self.eph.calculate_planet(current_jd, planet, sidereal=True)
-        last_diff = (pos["longitude"] - target_long + 180) % 360 - 180
-        
-        while current_jd < end_jd:
-            next_jd = current_jd + step
-            pos = self.eph.calculate_planet(next_jd, planet, sidereal=True)
-            current_diff = (pos["longitude"] - target_long + 180) % 360 - 180
+        last_jd: Optional[float] = None
+        last_diff: Optional[float] = None
+        for jd, lon in scan_longitudes(self.eph, planet, current_jd, end_jd, step):
+            current_diff = wrap180(lon - target_long)
             
-            if (last_diff < 0 and current_diff >= 0) or (last_diff > 0 and current_diff <= 0):
+            # Only sign flips near the target count: the diff also flips
+            # sign as it wraps at 180/-180 on the opposite side
+            if (last_jd is not None and last_diff is not None
+                    and abs(current_diff) < 90 and abs(last_diff) < 90
+                    and ((last_diff < 0 and current_diff >= 0) or (last_diff > 0 and current_diff <= 0))):
                 # Crossing found
-                exact_jd = self._refine_return(planet, target_long, current_jd, next_jd)
+                exact_jd = self._refine_return(planet, target_long, last_jd, jd, d1=last_diff, d2=current_diff)
                 return CycleEvent(
                     config=CycleConfig(planet=planet, harmonic=1, start_long=target_long),
                     exact_time=exact_jd,
                     error_margin=abs(current_diff) # This will be refined
                 )
             
+            last_jd = jd
             last_diff = current_diff
-            current_jd = next_jd
             
         raise Exception(f"Return not found for {planet} within {window_days} days")
 
-    def _refine_return(self, planet: Planet, target_lon: float, jd1: float, jd2: float, tolerance: float = 1e-7) -> float:
-        low = jd1
-        high = jd2
-        for _ in range(30):
-            mid = (low + high) / 2
-            pos = self.eph.calculate_planet(mid, planet, sidereal=True)
-            diff = (pos["longitude"] - target_lon + 180) % 360 - 180
-            
-            if diff > 0:
-                high = mid
-            else:
-                low = mid
-            if abs(high - low) < tolerance:
-                break
-        return (low + high) / 2
+    def _refine_return(self, planet: Planet, target_lon: float, jd1: float, jd2: float, tolerance: float = 1e-7,
+                       d1: Optional[float] = None, d2: Optional[float] = None) -> float:
+        """
+        Refine a bracketed return. d1/d2 are the signed differences at jd1/jd2
+        if the caller already has them, to save two ephemeris calls.
+        """
+        def diff(jd: float) -> float:
+            pos = self.eph.calculate_planet(jd, planet, sidereal=True)
+            return wrap180(pos.longitude - target_lon)
+
+        return find_root(diff, jd1, jd2, d1, d2, xtol=tolerance)
 
     def compute_synodic_cycle(self, p1: Planet, p2: Planet, start_time: Time) -> List[CycleEvent]:
         """
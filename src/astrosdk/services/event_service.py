@@ -1,8 +1,11 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..core.ephemeris import Ephemeris
 from ..core.time import Time
-from ..core.constants import Planet, MAX_SEARCH_DAYS, SiderealMode
+from ..core.constants import Planet, MAX_SEARCH_DAYS, SiderealMode, _INV_30
 from ..core.errors import SearchRangeTooLargeError
+from ..core.angles import wrap180
+from ..core.roots import find_root
+from ..core.scan import scan_positions
 from ..domain.event import AstroEvent, EclipseEvent
 from .aspect_service import AspectService
 from ..domain.planet import PlanetPosition
@@ -22,7 +25,7 @@ class EventService:
         Scan for sign ingresses within a time range.
         Uses a step-discovery followed by bisection refinement.
         """
-        self.eph.set_sidereal_mode(sidereal_mode)
+        self.eph.use_sidereal_mode(sidereal_mode)
         events = []
         current_jd = start_time.julian_day
         end_jd = end_time.julian_day
@@ -30,18 +33,16 @@ class EventService:
         if (end_jd - current_jd) > MAX_SEARCH_DAYS:
             raise SearchRangeTooLargeError(f"Search range exceeds maximum allowed limit of {MAX_SEARCH_DAYS} days.")
 
-        # Get initial sign
-        pos = self.eph.calculate_planet(current_jd, planet, sidereal=True)
-        last_sign = int(pos["longitude"] / 30)
-        
-        while current_jd < end_jd:
-            next_jd = min(current_jd + step_days, end_jd)
-            pos = self.eph.calculate_planet(next_jd, planet, sidereal=True)
-            current_sign = int(pos["longitude"] / 30)
+        last_jd: Optional[float] = None
+        last_lon: Optional[float] = None
+        last_sign: Optional[int] = None
+        for jd, pos in scan_positions(self.eph, planet, current_jd, end_jd, step_days):
+            current_sign = int(pos.longitude * _INV_30)
             
-            if current_sign != last_sign:
-                # Ingress found between current_jd and next_jd
-                exact_jd = self._refine_ingress(planet, current_jd, next_jd, last_sign, current_sign)
+            if last_jd is not None and last_sign is not None and current_sign != last_sign:
+                # Ingress found between last_jd and jd
+                exact_jd = self._refine_ingress(planet, last_jd, jd, last_sign, current_sign,
+                                                lon1=last_lon, lon2=pos.longitude)
                 events.append(AstroEvent(
                     type="INGRESS",
                     primary_body=planet,
@@ -50,8 +51,7 @@ class EventService:
                     data={"sign_from": str(last_sign), "sign_to": str(current_sign)}
                 ))
             
-            last_sign = current_sign
-            current_jd = next_jd
+            last_jd, last_lon, last_sign = jd, pos.longitude, current_sign
             
         return events
 
@@ -61,7 +61,7 @@ class EventService:
         """
         Scan for retrograde/direct stations (speed crossing zero).
         """
-        self.eph.set_sidereal_mode(sidereal_mode)
+        self.eph.use_sidereal_mode(sidereal_mode)
         events = []
         current_jd = start_time.julian_day
         end_jd = end_time.julian_day
@@ -69,17 +69,15 @@ class EventService:
         if (end_jd - current_jd) > MAX_SEARCH_DAYS:
             raise SearchRangeTooLargeError(f"Search range exceeds maximum allowed limit of {MAX_SEARCH_DAYS} days.")
 
-        pos = self.eph.calculate_planet(current_jd, planet, sidereal=True)
-        last_speed = pos["speed_long"]
-        
-        while current_jd < end_jd:
-            next_jd = min(current_jd + step_days, end_jd)
-            pos = self.eph.calculate_planet(next_jd, planet, sidereal=True)
-            current_speed = pos["speed_long"]
+        last_jd: Optional[float] = None
+        last_speed: Optional[float] = None
+        for jd, pos in scan_positions(self.eph, planet, current_jd, end_jd, step_days):
+            current_speed = pos.speed_long
             
-            if (last_speed > 0 and current_speed < 0) or (last_speed < 0 and current_speed > 0):
+            if last_jd is not None and last_speed is not None and (
+                    (last_speed > 0 and current_speed < 0) or (last_speed < 0 and current_speed > 0)):
                 # Station found
-                exact_jd = self._refine_station(planet, current_jd, next_jd)
+                exact_jd = self._refine_station(planet, last_jd, jd, v1=last_speed, v2=current_speed)
                 events.append(AstroEvent(
                     type="STATION",
                     primary_body=planet,
@@ -87,57 +85,38 @@ class EventService:
                     julian_day=exact_jd,
                     data={"speed_before": f"{last_speed:.6f}", "speed_after": f"{current_speed:.6f}"}
                 ))
-                
-            last_speed = current_speed
-            current_jd = next_jd
+            
+            last_jd, last_speed = jd, current_speed
             
         return events
 
-    def _refine_ingress(self, planet: Planet, jd1: float, jd2: float, s1: int, s2: int, tolerance: float = 1e-7) -> float:
-        """Bisection for ingress refinement."""
-        target_lon = s2 * 30.0
-        # Handle Pisces -> Aries wrap
-        if s1 == 11 and s2 == 0:
-            target_lon = 0.0
-            
-        low = jd1
-        high = jd2
-        for _ in range(30): # Fixed iterations for deterministic precision
-            mid = (low + high) / 2
-            pos = self.eph.calculate_planet(mid, planet, sidereal=True)
-            lon = pos["longitude"]
-            
+    def _refine_ingress(self, planet: Planet, jd1: float, jd2: float, s1: int, s2: int, tolerance: float = 1e-7,
+                        lon1: Optional[float] = None, lon2: Optional[float] = None) -> float:
+        """Root-find the exact ingress time. lon1/lon2 are the scan's longitudes at jd1/jd2, if known."""
+        # The boundary between the two signs: the start of s2 when moving
+        # direct, the start of s1 when moving retrograde
+        if (s2 - s1) % 12 == 1:
+            target_lon = s2 * 30.0
+        else:
+            target_lon = s1 * 30.0
+        target_lon %= 360.0
+
+        def diff(jd: float) -> float:
             # Normalize longitude relative to target for wrap-around cases
-            diff = (lon - target_lon + 180) % 360 - 180
-            
-            if diff > 0:
-                high = mid
-            else:
-                low = mid
-            if abs(high - low) < tolerance:
-                break
-        return (low + high) / 2
-
-    def _refine_station(self, planet: Planet, jd1: float, jd2: float, tolerance: float = 1e-7) -> float:
-        """Bisection for station refinement (speed = 0)."""
-        low = jd1
-        high = jd2
-        pos1 = self.eph.calculate_planet(jd1, planet, sidereal=True)
-        v1 = pos1["speed_long"]
-        
-        for _ in range(30):
-            mid = (low + high) / 2
-            pos = self.eph.calculate_planet(mid, planet, sidereal=True)
-            v_mid = pos["speed_long"]
-            
-            if (v1 > 0 and v_mid > 0) or (v1 < 0 and v_mid < 0):
-                low = mid
-                v1 = v_mid
-            else:
-                high = mid
-            if abs(high - low) < tolerance:
-                break
-        return (low + high) / 2
+            lon = self.eph.calculate_planet(jd, planet, sidereal=True).longitude
+            return wrap180(lon - target_lon)
+
+        fa = None if lon1 is None else wrap180(lon1 - target_lon)
+        fb = None if lon2 is None else wrap180(lon2 - target_lon)
+        return find_root(diff, jd1, jd2, fa, fb, xtol=tolerance)
+
+    def _refine_station(self, planet: Planet, jd1: float, jd2: float, tolerance: float = 1e-7,
+                        v1: Optional[float] = None, v2: Optional[float] = None) -> float:
+        """Root-find the station (speed = 0). v1/v2 are the scan's speeds at jd1/jd2, if known."""
+        def speed(jd: float) -> float:
+            return self.eph.calculate_planet(jd, planet, sidereal=True).speed_long
+
+        return find_root(speed, jd1, jd2, v1, v2, xtol=tolerance)
 
     def scan_aspects(self, p1: Planet, p2: Planet, start_time: Time, end_time: Time) -> List[AstroEvent]:
         """
@@ -152,28 +131,28 @@ class EventService:
         Finds the next solar eclipse globally.
         """
         res = self.eph.search_solar_eclipse(start_time.julian_day)
-        return EclipseEvent(
-            type="SOLAR",
-            julian_day=res["peak_jd"], # We use peak_jd as the primary JD
-            is_total=res["magnitude"] >= 1.0,
-            is_annular=False, # Need more Swiss data for precise flag
-            magnitude=res["magnitude"],
-            peak_jd=res["peak_jd"]
-        )
+        return _eclipse_event("SOLAR", res)
 
     def find_next_lunar_eclipse(self, start_time: Time) -> EclipseEvent:
         """
         Finds the next lunar eclipse.
         """
         res = self.eph.search_lunar_eclipse(start_time.julian_day)
-        return EclipseEvent(
-            type="LUNAR",
-            julian_day=res["peak_jd"],
-            is_total=res["magnitude"] >= 1.0,
-            is_annular=False,
-            magnitude=res["magnitude"],
-            peak_jd=res["peak_jd"]
-        )
+        return _eclipse_event("LUNAR", res)
+
+    def find_solar_eclipses(self, start_time: Time, end_time: Time) -> List[EclipseEvent]:
+        """
+        Finds all solar eclipses between start_time and end_time.
+        """
+        found = self.eph.search_solar_eclipses(start_time.julian_day, end_time.julian_day)
+        return [_eclipse_event("SOLAR", res) for res in found]
+
+    def find_lunar_eclipses(self, start_time: Time, end_time: Time) -> List[EclipseEvent]:
+        """
+        Finds all lunar eclipses between start_time and end_time.
+        """
+        found = self.eph.search_lunar_eclipses(start_time.julian_day, end_time.julian_day)
+        return [_eclipse_event("LUNAR", res) for res in found]
 
     def get_rise_set(self, planet: Planet, time: Time, lat: float, lon: float, alt: float = 0.0):
         """
@@ -198,3 +177,14 @@ class EventService:
             "rise": res_rise[0] if res_rise else None,
             "set": res_set[0] if res_set else None
         }
+
+
+def _eclipse_event(kind: str, res: Dict[str, float]) -> EclipseEvent:
+    return EclipseEvent(
+        type=kind,
+        julian_day=res["peak_jd"], # We use peak_jd as the primary JD
+        is_total=res["magnitude"] >= 1.0,
+        is_annular=False, # Need more Swiss data for precise flag
+        magnitude=res["magnitude"],
+        peak_jd=res["peak_jd"]
+    )
@@ -26,4 +26,12 @@ class FixedStarService:
         """
         Calculates positions for multiple stars.
         """
-        return [self.get_star_position(name, time, sidereal) for name in star_names]
+        return [
+            FixedStarPosition(
+                name=str(data["name"]),
+                longitude=data["longitude"],
+                latitude=data["latitude"],
+                magnitude=data["magnitude"]
+            )
+            for data in self._ephe.calculate_fixed_stars(time.julian_day, star_names, sidereal)
+        ]
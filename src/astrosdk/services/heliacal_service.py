@@ -1,7 +1,9 @@
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from ..core.ephemeris import Ephemeris
 from ..core.time import Time
-from ..core.constants import Planet
+from ..core.constants import Planet, ALLOWED_PLANETS
+from ..core.roots import find_root
+from ..core.scan import scan_positions
 
 class HeliacalService:
     """
@@ -48,37 +50,41 @@ class HeliacalService:
         planet: Planet, 
         year: int, 
         forward: bool = True
-    ) -> List[Dict[str, any]]:
+    ) -> List[Dict[str, Any]]:
         """
         Find all stationary points (Retrograde/Direct) for a planet in a given year.
         """
-        results = []
+        results: List[Dict[str, Any]] = []
+        if planet not in ALLOWED_PLANETS or planet in (Planet.SUN, Planet.MOON):
+            return results # Sun/Moon don't go retrograde
+        
         # Start from Jan 1st of the year
         import datetime
         from datetime import timezone
-        current_jd = Time(datetime.datetime(year, 1, 1, tzinfo=timezone.utc)).julian_day
+        start_jd = Time(datetime.datetime(year, 1, 1, tzinfo=timezone.utc)).julian_day
         end_jd = Time(datetime.datetime(year, 12, 31, 23, 59, tzinfo=timezone.utc)).julian_day
         
-        while current_jd < end_jd:
-            station_jd = self.eph.calculate_stationary_point(current_jd, planet, forward=True, max_days=365)
-            if station_jd is None or station_jd > end_jd:
-                break
-            
-            # Determine type (Direct to Retrograde or Retrograde to Direct)
-            # Check speed just before and after
-            speed_before = self.eph.calculate_planet(station_jd - 0.01, planet)["speed_long"]
-            speed_after = self.eph.calculate_planet(station_jd + 0.01, planet)["speed_long"]
-            
-            s_type = "Retrograde Station" if speed_before > 0 else "Direct Station"
-            
-            results.append({
-                "time": Time.from_julian_day(station_jd),
-                "type": s_type,
-                "jd": station_jd
-            })
-            
-            # Advance search window
-            current_jd = station_jd + 5.0 # Skip ahead to avoid finding same point
+        def speed(jd: float) -> float:
+            return self.eph.calculate_planet(jd, planet).speed_long
+        
+        # Sample the speed on a daily grid; a station is a sign change
+        # between neighbouring days
+        prev: Optional[Tuple[float, float]] = None
+        for jd, pos in scan_positions(self.eph, planet, start_jd, end_jd, 1.0):
+            v2 = pos.speed_long
+            if prev is not None and (prev[1] > 0) != (v2 > 0):
+                prev_jd, v1 = prev
+                station_jd = find_root(speed, prev_jd, jd, v1, v2)
+                
+                # Direct to Retrograde or Retrograde to Direct
+                s_type = "Retrograde Station" if v1 > 0 else "Direct Station"
+                
+                results.append({
+                    "time": Time.from_julian_day(station_jd),
+                    "type": s_type,
+                    "jd": station_jd
+                })
+            prev = (jd, v2)
             
         return results
 
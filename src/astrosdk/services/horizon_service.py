@@ -4,6 +4,12 @@ from ..core.ephemeris import Ephemeris
 from ..core.time import Time
 from ..core.constants import Planet
 
+_TWILIGHT_BITS = {
+    "civil": swe.BIT_CIVIL_TWILIGHT,
+    "nautical": swe.BIT_NAUTIC_TWILIGHT,
+    "astronomical": swe.BIT_ASTRO_TWILIGHT
+}
+
 class HorizonService:
     """
     Service for calculating rise, set, and transit times (Horizon events).
@@ -54,22 +60,35 @@ class HorizonService:
         Calculate dawn and dusk times for different twilight types.
         twilight_type: 'civil' (-6°), 'nautical' (-12°), 'astronomical' (-18°)
         """
-        types = {
-            "civil": swe.BIT_CIVIL_TWILIGHT,
-            "nautical": swe.BIT_NAUTIC_TWILIGHT,
-            "astronomical": swe.BIT_ASTRO_TWILIGHT
-        }
-        
-        if twilight_type not in types:
-            raise ValueError(f"Unknown twilight type: {twilight_type}. Must be one of {list(types.keys())}")
+        if twilight_type not in _TWILIGHT_BITS:
+            raise ValueError(f"Unknown twilight type: {twilight_type}. Must be one of {list(_TWILIGHT_BITS.keys())}")
             
-        bit = types[twilight_type]
+        bit = _TWILIGHT_BITS[twilight_type]
         
         # Dawn (rise) and Dusk (set)
-        dawn = self.calculate_event(Planet.SUN, date, lat, lon, altitude, is_rise=True, rsmi_extra=bit)
-        dusk = self.calculate_event(Planet.SUN, date, lat, lon, altitude, is_rise=False, rsmi_extra=bit)
+        dawn, dusk = self.eph.calculate_horizon_events(
+            date.julian_day, lat, lon, altitude,
+            events=((Planet.SUN, swe.CALC_RISE | bit), (Planet.SUN, swe.CALC_SET | bit))
+        )
         
         return {
-            "dawn": dawn,
-            "dusk": dusk
+            "dawn": Time.from_julian_day(dawn) if dawn else None,
+            "dusk": Time.from_julian_day(dusk) if dusk else None
         }
+
+    def calculate_sun_events(self, date: Time, lat: float, lon: float, altitude: float = 0.0) -> Dict[str, Optional[Time]]:
+        """
+        Calculate sunrise, sunset and all three twilights in one batch.
+        
+        Keys: 'sunrise', 'sunset', and 'dawn_<type>'/'dusk_<type>' for each
+        twilight type ('civil', 'nautical', 'astronomical'). Values match
+        `calculate_sunrise`, `calculate_sunset` and `calculate_twilight`.
+        """
+        keys = ["sunrise", "sunset"]
+        events = [(Planet.SUN, swe.CALC_RISE), (Planet.SUN, swe.CALC_SET)]
+        for name, bit in _TWILIGHT_BITS.items():
+            keys += [f"dawn_{name}", f"dusk_{name}"]
+            events += [(Planet.SUN, swe.CALC_RISE | bit), (Planet.SUN, swe.CALC_SET | bit)]
+        
+        jds = self.eph.calculate_horizon_events(date.julian_day, lat, lon, altitude, events=events)
+        return {key: Time.from_julian_day(jd) if jd else None for key, jd in zip(keys, jds, strict=True)}
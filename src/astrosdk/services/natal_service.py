@@ -1,10 +1,13 @@
-from typing import List, Dict, Optional
-from ..core.ephemeris import Ephemeris
+from typing import List, Dict, Optional, Tuple
+from ..core.ephemeris import Ephemeris, _SWISS_LOCK
 from ..core.time import Time
 from ..core.constants import Planet, HouseSystem, SiderealMode
 from ..domain.planet import PlanetPosition
 from ..domain.house import ChartHouses, HouseCusp, HouseAxes
 
+# Bodies calculated directly; Ketu (MEAN_NODE_OPP) is derived from the mean node.
+_NATAL_BODIES = tuple(p for p in Planet if p is not Planet.MEAN_NODE_OPP)
+
 class NatalService:
     """
     Pure service for calculating Natal Charts.
@@ -26,27 +29,49 @@ class NatalService:
         """
         # Ensure mode is set if provided
         if sidereal_mode is not None:
-            self.eph.set_sidereal_mode(sidereal_mode)
+            self.eph.use_sidereal_mode(sidereal_mode)
         
         is_sidereal = sidereal_mode is not None
+        return self._positions(time.julian_day, is_sidereal, heliocentric, lat, lon, alt)
+
+    def calculate_houses(self, time: Time, lat: float, lon: float, 
+                         system: HouseSystem = HouseSystem.PLACIDUS, 
+                         sidereal_mode: SiderealMode = SiderealMode.LAHIRI) -> ChartHouses:
+        """
+        Calculate house cusps.
+        """
+        return self._houses(time.julian_day, lat, lon, system, sidereal_mode)
+
+    def calculate_chart_data(self, time: Time, lat: float, lon: float,
+                             system: HouseSystem = HouseSystem.PLACIDUS,
+                             sidereal_mode: SiderealMode = SiderealMode.LAHIRI) -> Tuple[List[PlanetPosition], ChartHouses]:
+        """
+        Calculate planetary positions and house cusps together.
+        Sets the sidereal mode and Julian Day once, and holds the ephemeris
+        lock throughout so both halves are computed under the same mode.
+        """
         jd = time.julian_day
+        with _SWISS_LOCK:
+            self.eph.use_sidereal_mode(sidereal_mode)
+            planets = self._positions(jd, True, False, None, None, 0.0)
+            houses = self._houses(jd, lat, lon, system)
+        return planets, houses
+
+    def _positions(self, jd: float, is_sidereal: bool, heliocentric: bool,
+                   lat: Optional[float], lon: Optional[float], alt: float) -> List[PlanetPosition]:
         results = []
+        batch = self.eph.calculate_planets(jd, _NATAL_BODIES, sidereal=is_sidereal, heliocentric=heliocentric)
         
-        for planet in Planet:
-            if planet in [Planet.MEAN_NODE_OPP]:
-                continue
-                
-            data = self.eph.calculate_planet(jd, planet, sidereal=is_sidereal, heliocentric=heliocentric)
-            
+        for planet, data in zip(_NATAL_BODIES, batch, strict=True):
             # Calculate horizontal if geopos provided
             azimuth = None
             altitude = None
             if lat is not None and lon is not None:
                 hor = self.eph.calculate_horizontal(
                     jd, 
-                    data["longitude"], 
-                    data["latitude"], 
-                    data["distance"], 
+                    data.longitude, 
+                    data.latitude, 
+                    data.distance, 
                     lat, lon, alt
                 )
                 azimuth = hor["azimuth"]
@@ -54,35 +79,39 @@ class NatalService:
 
             p = PlanetPosition(
                 planet=planet,
-                longitude=data["longitude"],
-                latitude=data["latitude"],
-                distance=data["distance"],
-                speed_long=data["speed_long"],
-                speed_lat=data["speed_lat"],
-                speed_dist=data["speed_dist"],
+                longitude=data.longitude,
+                latitude=data.latitude,
+                distance=data.distance,
+                speed_long=data.speed_long,
+                speed_lat=data.speed_lat,
+                speed_dist=data.speed_dist,
                 azimuth=azimuth,
                 altitude=altitude
             )
             results.append(p)
             
             if planet == Planet.MEAN_NODE:
-                ketu_lon = (data["longitude"] + 180.0) % 360.0
+                # Input is already in [0, 360), so one conditional subtraction
+                # gives the same result as % 360 without the float modulo
+                ketu_lon = data.longitude + 180.0
+                if ketu_lon >= 360.0:
+                    ketu_lon -= 360.0
                 
                 k_az = None
                 k_alt = None
                 if lat is not None and lon is not None:
-                     k_hor = self.eph.calculate_horizontal(jd, ketu_lon, -data["latitude"], data["distance"], lat, lon, alt)
+                     k_hor = self.eph.calculate_horizontal(jd, ketu_lon, -data.latitude, data.distance, lat, lon, alt)
                      k_az = k_hor["azimuth"]
                      k_alt = k_hor["true_altitude"]
 
                 ketu = PlanetPosition(
                     planet=Planet.MEAN_NODE_OPP,
                     longitude=ketu_lon,
-                    latitude=-data["latitude"],
-                    distance=data["distance"],
-                    speed_long=data["speed_long"],
-                    speed_lat=data["speed_lat"],
-                    speed_dist=data["speed_dist"],
+                    latitude=-data.latitude,
+                    distance=data.distance,
+                    speed_long=data.speed_long,
+                    speed_lat=data.speed_lat,
+                    speed_dist=data.speed_dist,
                     azimuth=k_az,
                     altitude=k_alt
                 )
@@ -90,22 +119,15 @@ class NatalService:
 
         return results
 
-    def calculate_houses(self, time: Time, lat: float, lon: float, 
-                         system: HouseSystem = HouseSystem.PLACIDUS, 
-                         sidereal_mode: SiderealMode = SiderealMode.LAHIRI) -> ChartHouses:
-        """
-        Calculate house cusps.
-        """
-        self.eph.set_sidereal_mode(sidereal_mode)
-        jd = time.julian_day
-        
+    def _houses(self, jd: float, lat: float, lon: float, system: HouseSystem,
+                sidereal_mode: Optional[SiderealMode] = None) -> ChartHouses:
         try:
-            data = self.eph.calculate_houses(jd, lat, lon, system, sidereal=True)
+            data = self.eph.calculate_houses(jd, lat, lon, system, sidereal=True, sidereal_mode=sidereal_mode)
         except Exception as e:
             # Fallback for high latitudes where Placidus/Koch fail
             if system in [HouseSystem.PLACIDUS, HouseSystem.KOCH]:
                 # Fallback to Porphyry (System 'O') which is robust
-                data = self.eph.calculate_houses(jd, lat, lon, HouseSystem.PORPHYRY, sidereal=True)
+                data = self.eph.calculate_houses(jd, lat, lon, HouseSystem.PORPHYRY, sidereal=True, sidereal_mode=sidereal_mode)
             else:
                 raise
         
@@ -121,11 +143,19 @@ class NatalService:
             for i in range(len(raw_cusps)):
                 cusps.append(HouseCusp(number=i+1, longitude=raw_cusps[i]))
             
+        # ASC/MC are normalized by Ephemeris.calculate_houses
+        descendant = data["ascendant"] + 180.0
+        if descendant >= 360.0:
+            descendant -= 360.0
+        imum_coeli = data["mc"] + 180.0
+        if imum_coeli >= 360.0:
+            imum_coeli -= 360.0
+            
         axes = HouseAxes(
             ascendant=data["ascendant"],
             midheaven=data["mc"],
-            descendant=(data["ascendant"] + 180) % 360,
-            imum_coeli=(data["mc"] + 180) % 360,
+            descendant=descendant,
+            imum_coeli=imum_coeli,
             vertex=data["vertex"]
         )
         
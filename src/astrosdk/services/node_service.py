@@ -27,26 +27,28 @@ class NodeService:
         
         north = PlanetPosition(
             planet=planet,
-            longitude=data["longitude"],
-            latitude=data["latitude"],
-            distance=data["distance"],
-            speed_long=data["speed_long"],
-            speed_lat=data["speed_lat"],
-            speed_dist=data["speed_dist"]
+            longitude=data.longitude,
+            latitude=data.latitude,
+            distance=data.distance,
+            speed_long=data.speed_long,
+            speed_lat=data.speed_lat,
+            speed_dist=data.speed_dist
         )
         
         # South Node is strictly opposite
-        south_lon = (data["longitude"] + 180.0) % 360.0
+        south_lon = data.longitude + 180.0
+        if south_lon >= 360.0:
+            south_lon -= 360.0
         south_planet = Planet.TRUE_NODE if true_node else Planet.MEAN_NODE # Just for reference
         
         south = PlanetPosition(
             planet=Planet.MEAN_NODE_OPP, # Reusing this for south node representation
             longitude=south_lon,
-            latitude=-data["latitude"],
-            distance=data["distance"],
-            speed_long=data["speed_long"],
-            speed_lat=data["speed_lat"],
-            speed_dist=data["speed_dist"]
+            latitude=-data.latitude,
+            distance=data.distance,
+            speed_long=data.speed_long,
+            speed_lat=data.speed_lat,
+            speed_dist=data.speed_dist
         )
         
         return north, south
@@ -62,12 +64,12 @@ class NodeService:
         
         return PlanetPosition(
             planet=planet,
-            longitude=data["longitude"],
-            latitude=data["latitude"],
-            distance=data["distance"],
-            speed_long=data["speed_long"],
-            speed_lat=data["speed_lat"],
-            speed_dist=data["speed_dist"]
+            longitude=data.longitude,
+            latitude=data.latitude,
+            distance=data.distance,
+            speed_long=data.speed_long,
+            speed_lat=data.speed_lat,
+            speed_dist=data.speed_dist
         )
 
     def calculate_planetary_nodes(self, time: Time, planet: Planet) -> Dict[str, float]:
@@ -1,8 +1,44 @@
 from typing import List, Dict, Tuple
+import swisseph as swe
 from ..core.ephemeris import Ephemeris
 from ..core.time import Time
 from ..core.constants import Planet
 
+# (type, rsmi) of the four angles; the IC is the lower transit
+_PARAN_EVENTS = (
+    ("Rise", swe.CALC_RISE),
+    ("Set", swe.CALC_SET),
+    ("Transit", swe.CALC_MTRANSIT),
+    ("IC", swe.CALC_RISE | swe.CALC_ITRANSIT),
+)
+_PARAN_BODIES = tuple(p for p in Planet if p <= Planet.PLUTO or p == Planet.MOON)
+# (planet, type, rsmi) of every event find_parans looks up, in output order
+_PARAN_REQUESTS = tuple(
+    (p, event_type, rsmi)
+    for p in _PARAN_BODIES
+    for event_type, rsmi in _PARAN_EVENTS
+)
+_PARAN_HORIZON_EVENTS = tuple((p, rsmi) for p, _, rsmi in _PARAN_REQUESTS)
+
+
+def _match_events(jds: List[float], orb_jd: float) -> List[Tuple[int, int]]:
+    """
+    Index pairs (i, j), i < j, of the events at most orb_jd apart, in the
+    order a nested loop over the events would produce them.
+    Sweeps the events in time order, so only pairs inside the orb are visited.
+    """
+    order = sorted(range(len(jds)), key=jds.__getitem__)
+    pairs = []
+    for a, i in enumerate(order):
+        for b in range(a + 1, len(order)):
+            j = order[b]
+            if jds[j] - jds[i] > orb_jd:
+                break
+            pairs.append((i, j) if i < j else (j, i))
+    pairs.sort()
+    return pairs
+
+
 class ParanService:
     """
     Service for calculating Parans (simultaneous horizon/meridian events).
@@ -29,46 +65,31 @@ class ParanService:
         midnight = Time(datetime.datetime(time.dt.year, time.dt.month, time.dt.day, tzinfo=timezone.utc))
         jd = midnight.julian_day
         
-        events = []
-        planets_to_check = [p for p in Planet if p <= Planet.PLUTO or p == Planet.MOON]
-        
-        for p in planets_to_check:
-            # Rise
-            r = self.eph.calculate_rise_set(jd, p, lat, lon, altitude, is_rise=True)
-            if r: events.append({"planet": p, "type": "Rise", "jd": r})
-            
-            # Set
-            s = self.eph.calculate_rise_set(jd, p, lat, lon, altitude, is_rise=False)
-            if s: events.append({"planet": p, "type": "Set", "jd": s})
-            
-            # Transit (Upper)
-            t = self.eph.calculate_transit(jd, p, lat, lon, altitude)
-            if t: events.append({"planet": p, "type": "Transit", "jd": t})
-            
-            # IC (Lower Transit) - use rsmi_extra for lower transit
-            # swe.CALC_ITRANSIT is for lower transit
-            # I need to check the value of CALC_ITRANSIT
-            import swisseph as swe
-            ic = self.eph.calculate_rise_set(jd, p, lat, lon, altitude, rsmi_extra=swe.CALC_ITRANSIT)
-            if ic: events.append({"planet": p, "type": "IC", "jd": ic})
+        # Rise, set, upper transit and lower transit (IC) of every planet,
+        # fetched under a single lock acquisition
+        times = self.eph.calculate_horizon_events(
+            jd, lat, lon, altitude, _PARAN_HORIZON_EVENTS
+        )
+        events = [
+            {"planet": p, "type": event_type, "jd": event_jd}
+            for (p, event_type, _), event_jd in zip(_PARAN_REQUESTS, times, strict=True)
+            if event_jd
+        ]
 
         # 2. Compare all pairs
         results = []
         orb_jd = orb_minutes / (24 * 60)
         
-        for i in range(len(events)):
-            for j in range(i + 1, len(events)):
-                e1 = events[i]
-                e2 = events[j]
-                
-                if abs(e1["jd"] - e2["jd"]) <= orb_jd:
-                    results.append({
-                        "p1": e1["planet"],
-                        "type1": e1["type"],
-                        "p2": e2["planet"],
-                        "type2": e2["type"],
-                        "time": Time.from_julian_day((e1["jd"] + e2["jd"]) / 2.0),
-                        "orb_minutes": abs(e1["jd"] - e2["jd"]) * 24 * 60
-                    })
+        for i, j in _match_events([e["jd"] for e in events], orb_jd):
+            e1 = events[i]
+            e2 = events[j]
+            results.append({
+                "p1": e1["planet"],
+                "type1": e1["type"],
+                "p2": e2["planet"],
+                "type2": e2["type"],
+                "time": Time.from_julian_day((e1["jd"] + e2["jd"]) / 2.0),
+                "orb_minutes": abs(e1["jd"] - e2["jd"]) * 24 * 60
+            })
                     
         return results
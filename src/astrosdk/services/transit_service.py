@@ -1,5 +1,4 @@
 from typing import List
-from datetime import timedelta
 from ..core.ephemeris import Ephemeris
 from ..core.time import Time
 from ..core.constants import Planet, SiderealMode
@@ -16,27 +15,22 @@ class TransitService:
         """
         Calculate position of a single planet once per day for N days.
         """
-        self.eph.set_sidereal_mode(sidereal_mode)
-        results = []
+        self.eph.use_sidereal_mode(sidereal_mode)
         
-        start_dt = start_time.dt
+        # Whole days from a UT Julian Day are exact in floating point, so this
+        # matches Time(start_dt + timedelta(days=i)).julian_day
+        start_jd = start_time.julian_day
+        batch = self.eph.calculate_planet_batch([start_jd + i for i in range(days)], planet, sidereal=True)
         
-        for i in range(days):
-            current_dt = start_dt + timedelta(days=i)
-            t = Time(current_dt)
-            jd = t.julian_day
-            
-            data = self.eph.calculate_planet(jd, planet, sidereal=True)
-             
-            p = PlanetPosition(
+        return [
+            PlanetPosition(
                 planet=planet,
-                longitude=data["longitude"],
-                latitude=data["latitude"],
-                distance=data["distance"],
-                speed_long=data["speed_long"],
-                speed_lat=data["speed_lat"],
-                speed_dist=data["speed_dist"]
+                longitude=data.longitude,
+                latitude=data.latitude,
+                distance=data.distance,
+                speed_long=data.speed_long,
+                speed_lat=data.speed_lat,
+                speed_dist=data.speed_dist
             )
-            results.append(p)
-            
-        return results
+            for data in batch
+        ]
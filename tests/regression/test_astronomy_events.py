@@ -45,6 +45,26 @@ def test_mercury_station_2024():
     assert t_station.month == 1
     assert t_station.day == 2
 
+def test_station_across_scan_batch_boundary():
+    """
+    A station between the last point of one scan batch and the first point
+    of the next is still found.
+    """
+    from astrosdk.core.constants import SCAN_BATCH_SIZE
+    engine = EventEngine()
+    service = engine._event_service
+    events = service.scan_stations(Planet.MERCURY, Time.from_string("2023-12-30 00:00:00"),
+                                   Time.from_string("2024-01-05 00:00:00"))
+    assert len(events) == 1
+    station_jd = events[0].julian_day
+    
+    # Place the station half a day after grid point SCAN_BATCH_SIZE - 1
+    start = Time.from_julian_day(station_jd - (SCAN_BATCH_SIZE - 0.5))
+    end = Time.from_julian_day(station_jd + 10)
+    events = service.scan_stations(Planet.MERCURY, start, end)
+    
+    assert any(abs(e.julian_day - station_jd) < 1e-6 for e in events)
+
 def test_solar_return_2024():
     """
     Verify Solar Return calculation.
@@ -63,3 +83,33 @@ def test_solar_return_2024():
     # Sidereal Sun enters Aries approx April 13-14
     assert t_return.month == 4
     assert 13 <= t_return.day <= 15
+
+def test_return_skips_the_opposite_point():
+    """
+    The Sun starts near 256 deg sidereal, so the signed difference from 100
+    deg wraps past +/-180 before it reaches the target; that wrap is not a
+    return.
+    """
+    engine = CycleEngine()
+    start_time = Time.from_string("2024-01-01 00:00:00")
+    
+    cycle_event = engine._cycle_service.compute_return(Planet.SUN, 100.0, start_time)
+    
+    lon = engine._cycle_service.eph.calculate_planet(cycle_event.exact_time, Planet.SUN, sidereal=True)["longitude"]
+    assert abs((lon - 100.0 + 180) % 360 - 180) < 1e-4
+
+def test_mercury_ingresses_land_on_boundaries_2024():
+    """
+    Every ingress, including the ones made while retrograde, should be
+    refined onto the sign boundary between sign_from and sign_to.
+    """
+    engine = EventEngine()
+    start = Time.from_string("2024-01-01 00:00:00")
+    end = Time.from_string("2025-01-01 00:00:00")
+    
+    events = engine._event_service.scan_ingresses(Planet.MERCURY, start, end)
+    assert any((int(e.data["sign_to"]) - int(e.data["sign_from"])) % 12 == 11 for e in events)
+    
+    for event in events:
+        lon = engine._event_service.eph.calculate_planet(event.julian_day, Planet.MERCURY)["longitude"]
+        assert abs((lon + 15) % 30 - 15) < 1e-4
@@ -34,6 +34,18 @@ def test_future_solar_eclipse_2045(event_service):
     assert eclipse.type == "SOLAR"
     assert eclipse.is_total is True
 
+def test_eclipses_in_range_2024(event_service):
+    # 2024: solar on Apr 8 and Oct 2, lunar on Mar 25 and Sep 18
+    t_start = Time.from_string("2024-01-01 00:00:00")
+    t_end = Time.from_string("2024-12-31 00:00:00")
+    solar = event_service.find_solar_eclipses(t_start, t_end)
+    lunar = event_service.find_lunar_eclipses(t_start, t_end)
+    
+    assert [Time.from_julian_day(e.peak_jd).dt.strftime("%m-%d") for e in solar] == ["04-08", "10-02"]
+    assert [Time.from_julian_day(e.peak_jd).dt.strftime("%m-%d") for e in lunar] == ["03-25", "09-18"]
+    assert solar[0] == event_service.find_next_solar_eclipse(t_start)
+    assert lunar[0] == event_service.find_next_lunar_eclipse(t_start)
+
 def test_historical_jupiter_ingress_1950(event_service):
     # Jupiter ingress detection in 1950 (Sidereal Lahiri)
     # Verify that the scanner detects sign changes for slow-moving planets
@@ -38,6 +38,16 @@ def test_fixed_star_sirius():
     assert 75 < sirius.longitude < 85 
     assert sirius.magnitude < 0 # Sirius is very bright (-1.46)
 
+def test_fixed_stars_batch_matches_single():
+    """The batched star lookup returns the same positions, in order."""
+    service = FixedStarService()
+    time = Time.from_string("2024-01-01 00:00:00")
+    names = ["Spica", "Sirius", "Regulus", "Spica"]
+
+    batch = service.get_stars_positions(names, time)
+    assert batch == [service.get_star_position(name, time) for name in names]
+    assert batch[1].name.startswith("Sirius")
+
 def test_solar_eclipse_2024():
     """Verify the Great American Eclipse of April 8, 2024."""
     eph = Ephemeris()
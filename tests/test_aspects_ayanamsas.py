@@ -78,6 +78,17 @@ class TestAllAspects:
         # Should find more aspects when including all types
         assert len(aspects) > 0
     
+    def test_single_filter_string(self, natal_service):
+        """Test that a bare filter string is treated as a one-item list."""
+        time = Time(datetime(2000, 1, 1, 12, 0, tzinfo=timezone.utc))
+        planets = natal_service.calculate_positions(time)
+        
+        aspect_service = AspectService()
+        for aspect_type in ('all', 'major'):
+            aspects = aspect_service.calculate_aspects(planets, aspect_types=aspect_type)
+            assert len(aspects) > 0
+            assert aspects == aspect_service.calculate_aspects(planets, aspect_types=[aspect_type])
+    
     def test_custom_orbs(self, natal_service):
         """Test custom orb configuration."""
         time = Time(datetime(2000, 1, 1, 12, 0, tzinfo=timezone.utc))
@@ -37,3 +37,22 @@ def test_houses():
     
     assert len(chart.houses.cusps) == 12
     assert chart.houses.axes.ascendant > 0
+
+def test_engine_metadata():
+    from astrosdk.engine import get_engine_metadata
+    meta = get_engine_metadata()
+    assert isinstance(meta["pyswisseph_version"], str)
+    assert meta["sidereal_default"] == "LAHIRI"
+    # Each call returns a fresh dict, so callers may mutate it safely
+    meta["sidereal_default"] = "X"
+    assert get_engine_metadata()["sidereal_default"] == "LAHIRI"
+
+def test_chart_data_matches_separate_calls():
+    from astrosdk.core.ephemeris import Ephemeris
+    from astrosdk.services.natal_service import NatalService
+    natal = NatalService(Ephemeris())
+    t = Time.from_string("2024-01-01 00:00:00")
+
+    planets, houses = natal.calculate_chart_data(t, 51.5, 0.0, HouseSystem.PLACIDUS, SiderealMode.FAGAN_BRADLEY)
+    assert planets == natal.calculate_positions(t, SiderealMode.FAGAN_BRADLEY)
+    assert houses == natal.calculate_houses(t, 51.5, 0.0, HouseSystem.PLACIDUS, SiderealMode.FAGAN_BRADLEY)
@@ -89,3 +89,38 @@ class TestCrossingService:
         
         return_pos = ephemeris.calculate_planet(return_time.julian_day, Planet.MARS, sidereal=True, heliocentric=True)
         assert abs(return_pos["longitude"] - target_lon) < 0.01
+
+    def test_return_near_station_finds_first_crossing(self, crossing_service, ephemeris):
+        """A target just short of a station is crossed twice within a few days; the first one must win."""
+        from astrosdk.services.event_service import EventService
+        start = Time(datetime(2024, 5, 1, 0, 0, tzinfo=timezone.utc))
+        end = Time(datetime(2024, 8, 1, 0, 0, tzinfo=timezone.utc))
+        station = EventService(ephemeris).scan_stations(Planet.SATURN, start, end)[0]
+        
+        station_lon = ephemeris.calculate_planet(station.julian_day, Planet.SATURN)["longitude"]
+        return_time = crossing_service.find_planetary_return(
+            Planet.SATURN, station_lon - 0.0005, start, max_search_years=1.0
+        )
+        
+        assert return_time.julian_day < station.julian_day
+
+    def test_ingress_just_before_boundary_returns_start(self, crossing_service):
+        """Starting less than a second before the boundary is treated as already at it."""
+        start_time = Time(datetime(2000, 1, 1, 12, 0, tzinfo=timezone.utc))
+        ingress_time, sign_num = crossing_service.find_next_ingress(Planet.MARS, start_time)
+        
+        just_before = Time.from_julian_day(ingress_time.julian_day - 0.5 / 86400.0)
+        again_time, again_sign = crossing_service.find_next_ingress(Planet.MARS, just_before)
+        
+        assert again_time is just_before
+        assert again_sign == sign_num
+
+    def test_solar_returns_range_matches_single_years(self, crossing_service):
+        """The bootstrapped range agrees with one find_solar_return call per year."""
+        for sun_long in (263.0, 100.0):
+            returns = crossing_service.find_solar_returns_range(sun_long, 2000, 2010)
+            expected = [crossing_service.find_solar_return(sun_long, year) for year in range(2000, 2011)]
+            
+            assert len(returns) == 11
+            for got, want in zip(returns, expected, strict=True):
+                assert abs(got.julian_day - want.julian_day) * 86400.0 < 1.0
@@ -39,3 +39,20 @@ def test_house_cusp_sign():
 def test_aspect_dataclass():
     a = Aspect(Planet.SUN, Planet.MOON, 120.0, 1.0, "TRINE", True)
     assert a.type == "TRINE"
+
+def test_sign_wraps_out_of_range_longitudes():
+    # Sidereal cusps can land just below 0 after the ayanamsa is removed
+    assert HouseCusp(12, -5.0).sign == ZodiacSign.PISCES
+    assert HouseCusp(1, 360.0).sign == ZodiacSign.ARIES
+
+def test_derived_sign_is_not_a_field():
+    import copy
+    import pickle
+    from dataclasses import asdict
+    p = PlanetPosition(Planet.MARS, 95.5, 1.0, 1.5, 0.5, 0.0, 0.0)
+    assert "sign" not in asdict(p)
+    assert "sign_degree" not in asdict(p)
+    for restored in (pickle.loads(pickle.dumps(p)), copy.copy(p)):
+        assert restored == p
+        assert restored.sign == ZodiacSign.CANCER
+        assert restored.sign_degree == 5.5
@@ -2,7 +2,7 @@ import pytest
 from datetime import datetime, timezone
 from astrosdk.core.time import Time
 from astrosdk.core.ephemeris import Ephemeris
-from astrosdk.core.constants import Planet, HouseSystem, SiderealMode
+from astrosdk.core.constants import Planet, HouseSystem, SiderealMode, ZodiacSign
 from astrosdk.core.errors import (
     InvalidTimeError,
     UnsupportedPlanetError,
@@ -223,6 +223,27 @@ def test_aspect_applying_vs_separating(aspect_service):
     assert aspect_applying.applying is True, "Moon should be applying to Sun"
 
 
+def test_square_applying_vs_separating(aspect_service):
+    """Test that applying/separating follows the orb, not just the direction of motion."""
+    sun = PlanetPosition(Planet.SUN, 100.0, 0.0, 1.0, 1.0, 0.0, 0.0)
+    # 88° ahead of the Sun: closing in on 90° only if it pulls further ahead
+    moon = PlanetPosition(Planet.MOON, 188.0, 0.0, 1.0, 13.0, 0.0, 0.0)
+    mars = PlanetPosition(Planet.MARS, 188.0, 0.0, 1.0, 0.5, 0.0, 0.0)
+    
+    assert aspect_service.get_aspect(sun, moon).type == "SQUARE"
+    assert aspect_service.get_aspect(sun, moon).applying is True
+    assert aspect_service.get_aspect(sun, mars).applying is False
+    
+    # Same geometry on the other side of the circle (angular diff ~ -88°)
+    moon_west = PlanetPosition(Planet.MOON, 12.0, 0.0, 1.0, 13.0, 0.0, 0.0)
+    assert aspect_service.get_aspect(sun, moon_west).applying is False
+    
+    # Opposition short of exact with the gap still widening
+    saturn = PlanetPosition(Planet.SATURN, 275.0, 0.0, 1.0, 0.1, 0.0, 0.0)
+    assert aspect_service.get_aspect(sun, saturn).type == "OPPOSITION"
+    assert aspect_service.get_aspect(sun, saturn).applying is False
+
+
 # ============================================================================
 # INVALID INPUT HANDLING TESTS
 # ============================================================================
@@ -242,6 +263,165 @@ def test_unsupported_planet_rejected(ephemeris):
         ephemeris.calculate_planet(t.julian_day, 999)
 
 
+def test_batch_planets_match_single_calls(ephemeris):
+    """Test that the batched calculation matches per-planet calls and validates every planet."""
+    jd = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)).julian_day
+    planets = [Planet.SUN, Planet.MOON, Planet.CHIRON]
+    
+    batch = ephemeris.calculate_planets(jd, planets)
+    assert batch == [ephemeris.calculate_planet(jd, p) for p in planets]
+    
+    with pytest.raises(UnsupportedPlanetError):
+        ephemeris.calculate_planets(jd, [Planet.SUN, 999])
+
+
+def test_batch_julian_days_match_single_calls(ephemeris):
+    """Test that the per-JD batch matches single calls, in order."""
+    jd = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)).julian_day
+    jds = [jd + 0.5 * i for i in range(10)]
+
+    batch = ephemeris.calculate_planet_batch(jds, Planet.MERCURY, heliocentric=True)
+    assert batch == [ephemeris.calculate_planet(j, Planet.MERCURY, heliocentric=True) for j in jds]
+    assert ephemeris.calculate_planet_batch([], Planet.SUN) == []
+
+    with pytest.raises(UnsupportedPlanetError):
+        ephemeris.calculate_planet_batch(jds, 999)
+
+
+def test_daily_positions_match_single_days(ephemeris):
+    """Test that daily transit positions land on the same day boundaries as per-day times."""
+    from datetime import timedelta
+    from astrosdk.services.transit_service import TransitService
+    start = datetime(2024, 3, 1, 6, 30, 15, tzinfo=timezone.utc)
+    
+    positions = TransitService(ephemeris).get_daily_positions(Time(start), 5, Planet.MARS)
+    assert len(positions) == 5
+    for i, pos in enumerate(positions):
+        data = ephemeris.calculate_planet(Time(start + timedelta(days=i)).julian_day, Planet.MARS)
+        assert pos.planet == Planet.MARS
+        assert pos.longitude == data["longitude"]
+        assert pos.speed_long == data["speed_long"]
+
+
+def test_planet_result_dict_compatibility(ephemeris):
+    """Test that planet results still read like the dictionaries they replaced."""
+    jd = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)).julian_day
+    pos = ephemeris.calculate_planet(jd, Planet.MARS)
+    
+    assert pos["longitude"] == pos.longitude == pos[0]
+    assert pos["speed_dist"] == pos.speed_dist
+    assert "speed_long" in pos and "azimuth" not in pos
+    assert dict(pos) == {"longitude": pos.longitude, "latitude": pos.latitude, "distance": pos.distance,
+                         "speed_long": pos.speed_long, "speed_lat": pos.speed_lat, "speed_dist": pos.speed_dist}
+    assert pos.get("latitude") == pos.latitude
+    assert pos.get("azimuth") is None and pos.get("azimuth", 0.0) == 0.0
+    assert list(pos.keys()) == [k for k, _ in pos.items()]
+    assert list(pos.values()) == list(pos)
+    with pytest.raises(KeyError):
+        pos["azimuth"]
+    with pytest.raises(KeyError):
+        pos["index"]  # tuple methods are not fields
+
+
+def test_memoized_positions_follow_global_state(ephemeris):
+    """Test that repeated calculations never return results computed under another mode."""
+    from astrosdk.core.ephemeris_context import EphemerisContext
+    jd = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)).julian_day
+    
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI)
+    lahiri = ephemeris.calculate_planet(jd, Planet.SUN)
+    with pytest.raises(TypeError):
+        lahiri["longitude"] = -1.0  # cached results are shared, so immutable
+    
+    ephemeris.set_sidereal_mode(SiderealMode.FAGAN_BRADLEY)
+    fagan = ephemeris.calculate_planet(jd, Planet.SUN)
+    assert abs(fagan["longitude"] - ephemeris.calculate_planet(jd, Planet.SUN, sidereal=False)["longitude"]) > 20
+    
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI)
+    again = ephemeris.calculate_planet(jd, Planet.SUN)
+    assert again["longitude"] != fagan["longitude"]
+    assert again["longitude"] > 0
+    
+    with EphemerisContext(sid_mode=SiderealMode.FAGAN_BRADLEY):
+        assert ephemeris.calculate_planet(jd, Planet.SUN) == fagan
+    assert ephemeris.calculate_planet(jd, Planet.SUN) == again
+
+
+def test_unchanged_sidereal_mode_skips_library(ephemeris, monkeypatch):
+    """Test that re-applying the current sidereal mode does not call into swisseph."""
+    import swisseph as swe
+    calls = []
+    real = swe.set_sid_mode
+    monkeypatch.setattr(swe, "set_sid_mode", lambda *args: calls.append(args) or real(*args))
+
+    ephemeris.set_sidereal_mode(SiderealMode.FAGAN_BRADLEY)
+    calls.clear()
+
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI)
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI)
+    assert len(calls) == 1
+
+    # t0/ayan_t0 are part of the mode
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI, 2451545.0, 23.0)
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI)
+    assert len(calls) == 3
+
+
+def test_house_calculation_keeps_custom_sidereal_epoch(ephemeris, monkeypatch):
+    """Test that houses in the current mode do not reset a custom t0/ayan_t0."""
+    import swisseph as swe
+    from astrosdk.core import ephemeris as ephemeris_module
+    jd = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)).julian_day
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI, 2451545.0, 23.0)
+    calls = []
+    real = swe.set_sid_mode
+    monkeypatch.setattr(swe, "set_sid_mode", lambda *args: calls.append(args) or real(*args))
+
+    ephemeris.calculate_houses(jd, 51.5, 0.0, sidereal_mode=SiderealMode.LAHIRI)
+    assert calls == []
+    assert ephemeris_module._sid_state == (SiderealMode.LAHIRI, 2451545.0, 23.0)
+
+    ephemeris.calculate_houses(jd, 51.5, 0.0, sidereal_mode=SiderealMode.FAGAN_BRADLEY)
+    assert len(calls) == 1
+
+
+def test_user_ayanamsa_shared_by_planets_and_houses(ephemeris, natal_service):
+    """Test that a USER mode with a custom t0 applies to planets and houses in either call order."""
+    time = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc))
+    jd = time.julian_day
+    sun_tropical = ephemeris.calculate_planet(jd, Planet.SUN, sidereal=False)["longitude"]
+    asc_tropical = ephemeris.calculate_houses(jd, 51.5, 0.0, sidereal=False)["ascendant"]
+
+    def planet_ayanamsa():
+        positions = natal_service.calculate_positions(time, sidereal_mode=SiderealMode.USER)
+        sun = next(p for p in positions if p.planet == Planet.SUN)
+        return (sun_tropical - sun.longitude) % 360.0
+
+    def house_ayanamsa():
+        houses = natal_service.calculate_houses(time, 51.5, 0.0, sidereal_mode=SiderealMode.USER)
+        return (asc_tropical - houses.axes.ascendant) % 360.0
+
+    # Tropical planets include nutation (~5 arcsec) and the house ayanamsa
+    # does not, so the two only agree to a few thousandths of a degree
+    try:
+        # 10 degrees at J2000, so roughly 10.3 degrees by 2024
+        ephemeris.set_sidereal_mode(SiderealMode.USER, 2451545.0, 10.0)
+        first = planet_ayanamsa()
+        assert abs(first - 10.3) < 0.1
+        assert abs(house_ayanamsa() - first) < 0.01
+
+        ephemeris.set_sidereal_mode(SiderealMode.USER, 2451545.0, 10.0)
+        assert abs(house_ayanamsa() - first) < 0.01
+        assert abs(planet_ayanamsa() - first) < 0.01
+
+        planets, houses = natal_service.calculate_chart_data(time, 51.5, 0.0, sidereal_mode=SiderealMode.USER)
+        sun = next(p for p in planets if p.planet == Planet.SUN)
+        assert abs((sun_tropical - sun.longitude) % 360.0 - first) < 0.01
+        assert abs((asc_tropical - houses.axes.ascendant) % 360.0 - first) < 0.01
+    finally:
+        ephemeris.set_sidereal_mode(SiderealMode.LAHIRI)
+
+
 def test_search_range_too_large_solar(ephemeris):
     """Test that excessively large search ranges are rejected for solar eclipses."""
     t_start = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc))
@@ -284,6 +464,35 @@ def test_longitude_wraparound(ephemeris):
     assert 0 <= pos['longitude'] < 360
 
 
+def test_sidereal_house_wraparound(natal_service):
+    """Test that sidereal cusps stay in 0-360° when the tropical ASC is below the ayanamsa."""
+    # Tropical ASC is ~8° Aries here, less than the ~24° Lahiri ayanamsa
+    t = Time(datetime(2024, 1, 1, 11, 40, 0, tzinfo=timezone.utc))
+    houses = natal_service.calculate_houses(t, 51.5, 0.0)
+
+    assert 0 <= houses.axes.ascendant < 360
+    assert all(0 <= c.longitude < 360 for c in houses.cusps)
+    assert houses.cusps[0].sign == ZodiacSign.PISCES
+
+
+def test_tropical_houses_offset_by_ayanamsa(ephemeris):
+    """Test that tropical and sidereal cusps differ by exactly the ayanamsa."""
+    jd = Time(datetime(2024, 1, 1, 11, 40, 0, tzinfo=timezone.utc)).julian_day
+    tropical = ephemeris.calculate_houses(jd, 51.5, 0.0, sidereal=False)
+    sidereal = ephemeris.calculate_houses(jd, 51.5, 0.0, sidereal=True, sidereal_mode=SiderealMode.LAHIRI)
+    
+    assert all(0 <= c < 360 for c in tropical["cusps"])
+    ayanamsa = (tropical["ascendant"] - sidereal["ascendant"]) % 360.0
+    assert 23 < ayanamsa < 25
+    for trop, sid in zip(tropical["cusps"], sidereal["cusps"], strict=True):
+        assert abs((trop - sid) % 360.0 - ayanamsa) < 1e-9
+    
+    # Same instant under another mode must not reuse the Lahiri ayanamsa
+    fagan = ephemeris.calculate_houses(jd, 51.5, 0.0, sidereal=True, sidereal_mode=SiderealMode.FAGAN_BRADLEY)
+    assert abs(fagan["ascendant"] - sidereal["ascendant"]) > 0.5
+    ephemeris.set_sidereal_mode(SiderealMode.LAHIRI)
+
+
 def test_latitude_bounds(ephemeris):
     """Test that latitude values are within valid range."""
     t = Time(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc))
@@ -333,3 +542,48 @@ def test_high_precision_delta_t(ephemeris):
     
     # Delta-T should change very slightly over 1 second
     assert abs(dt1 - dt2) < 0.0001  # Less than 0.0001 days = 8.64 seconds
+
+
+def test_find_root_brackets():
+    """Test the shared root finder converges and rejects a missing bracket."""
+    from astrosdk.core.roots import find_root
+    calls = []
+    
+    def f(x):
+        calls.append(x)
+        return x ** 3 - 2.0
+    
+    root = find_root(f, 0.0, 2.0, xtol=1e-10)
+    assert abs(root - 2.0 ** (1 / 3)) < 1e-9
+    assert len(calls) < 20
+    
+    with pytest.raises(ValueError):
+        find_root(f, 2.0, 3.0)
+    
+    # Running out of iterations still yields a root within xtol, on the b side
+    for maxiter in (1, 3, 100):
+        root = find_root(lambda x: (x - 0.3) ** 5, 4.0, -7.0, xtol=1e-9, maxiter=maxiter)
+        assert abs(root - 0.3) <= 1e-9
+        assert root <= 0.3
+
+
+def test_time_grid_clamps_last_step():
+    """Test the shared scan grid ends exactly at the end of the range."""
+    from astrosdk.core.scan import time_grid
+    assert list(time_grid(10.0, 12.5, 1.0)) == [10.0, 11.0, 12.0, 12.5]
+    assert list(time_grid(10.0, 12.0, 1.0)) == [10.0, 11.0, 12.0]
+    assert list(time_grid(10.0, 10.0, 1.0)) == [10.0]
+
+
+def test_wrap180_range():
+    """Test signed angle normalization to [-180, 180)."""
+    from astrosdk.core.angles import wrap180
+    assert wrap180(0.0) == 0.0
+    assert wrap180(180.0) == -180.0
+    assert wrap180(-180.0) == -180.0
+    assert wrap180(359.5) == -0.5
+    assert wrap180(-359.5) == 0.5
+    assert wrap180(10.0 - 350.0) == 20.0
+    assert wrap180(540.0) == -180.0
+    assert wrap180(-900.0) == -180.0
+    assert wrap180(1085.0) == 5.0
@@ -49,6 +49,14 @@ class TestHorizontalAndHeliacal:
         for i in range(len(stations)-1):
             assert stations[i]["jd"] < stations[i+1]["jd"]
 
+    def test_station_types_alternate(self, heliacal_service):
+        """Test that retrograde and direct stations alternate through the year."""
+        stations = heliacal_service.find_all_stations(Planet.MERCURY, 2023)
+        types = [s["type"] for s in stations]
+        
+        assert len(types) >= 6
+        assert all(a != b for a, b in zip(types[:-1], types[1:], strict=True))
+
     def test_heliacal_rising_venice(self, heliacal_service):
         """Test heliacal rising calculation for Venus."""
         # Venus heliacal rising in 2024
@@ -66,3 +74,15 @@ class TestHorizontalAndHeliacal:
         jd = Time(datetime(2024, 1, 1, tzinfo=timezone.utc)).julian_day
         assert ephemeris.calculate_stationary_point(jd, Planet.SUN) is None
         assert ephemeris.calculate_stationary_point(jd, Planet.MOON) is None
+
+    def test_station_direction_forward_and_backward(self, ephemeris):
+        """Test that the station direction is reported in time order whichever way we search."""
+        # Mercury stations retrograde on 2024-04-01 and direct on 2024-04-25
+        jd = Time(datetime(2024, 4, 10, tzinfo=timezone.utc)).julian_day
+        
+        next_jd, next_dir = ephemeris.calculate_station(jd, Planet.MERCURY, forward=True)
+        prev_jd, prev_dir = ephemeris.calculate_station(jd, Planet.MERCURY, forward=False)
+        
+        assert prev_jd < jd < next_jd
+        assert prev_dir == 1 and next_dir == -1
+        assert ephemeris.calculate_stationary_point(jd, Planet.MERCURY) == next_jd
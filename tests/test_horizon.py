@@ -69,3 +69,19 @@ class TestHorizonService:
         assert astro["dawn"].julian_day < nautic["dawn"].julian_day < civil["dawn"].julian_day
         # Order of dusk: civil < nautic < astro
         assert civil["dusk"].julian_day < nautic["dusk"].julian_day < astro["dusk"].julian_day
+
+    def test_sun_events_match_single_calls(self, horizon_service):
+        """Test that the bulk sun events agree with the individual methods."""
+        date = Time(datetime(2024, 3, 20, 0, 0, tzinfo=timezone.utc))
+        lat, lon = 51.5074, -0.1278 # London
+        
+        events = horizon_service.calculate_sun_events(date, lat, lon)
+        
+        assert events["sunrise"].julian_day == horizon_service.calculate_sunrise(date, lat, lon).julian_day
+        assert events["sunset"].julian_day == horizon_service.calculate_sunset(date, lat, lon).julian_day
+        for kind in ("civil", "nautical", "astronomical"):
+            twilight = horizon_service.calculate_twilight(date, lat, lon, twilight_type=kind)
+            assert events[f"dawn_{kind}"].julian_day == twilight["dawn"].julian_day
+            assert events[f"dusk_{kind}"].julian_day == twilight["dusk"].julian_day
+        
+        assert events["dawn_astronomical"].julian_day < events["dawn_civil"].julian_day < events["sunrise"].julian_day
@@ -48,6 +48,20 @@ class TestParansAndAntiscia:
             assert p["orb_minutes"] <= 5.0
             assert isinstance(p["time"], Time)
 
+    def test_paran_matching_matches_all_pairs(self):
+        """The time-ordered sweep finds the same pairs, in the same order, as comparing every pair."""
+        from astrosdk.services.paran_service import _match_events
+        jds = [2460390.40, 2460390.10, 2460390.401, 2460390.75, 2460390.1, 2460390.399]
+        orb_jd = 5.0 / (24 * 60)
+        
+        expected = [
+            (i, j) for i in range(len(jds)) for j in range(i + 1, len(jds))
+            if abs(jds[i] - jds[j]) <= orb_jd
+        ]
+        assert _match_events(jds, orb_jd) == expected
+        assert expected == [(0, 2), (0, 5), (1, 4), (2, 5)]
+        assert _match_events([], orb_jd) == []
+
     def test_antiscia_mirroring(self, natal_service):
         """Test that antiscia mirrors Cancer/Capricorn correctly."""
         # Planet at 60° (Gemini 0°) -> Antiscia 120° (Leo 0°)